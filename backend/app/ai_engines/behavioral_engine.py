@@ -2,13 +2,29 @@
 # DEPRECATED: HuggingFace imports removed - using OpenRouter instead
 # from transformers import pipeline
 # from sentence_transformers import SentenceTransformer
-from ..services.llm import llm_service
-# import numpy as np
+from ..services.llm import basic_sentiment
+from ..utils.keyword_matcher import KeywordHits
+from ..utils.text_utils import STAR_LEXICONS, scan_answer
+from ..utils.text_vectors import relevance, vectorize_cached
+import numpy as np
 import re
 import logging
 
 logger = logging.getLogger(__name__)
 
+_SPECIFICS_RE = re.compile(r'\b\d+\b|\b[A-Z][a-z]+\b.*\b\d{4}\b')
+_METRICS_RE = re.compile(r'\d+%|\d+ people|\$\d+')
+
+_EMPTY_ANSWER_RESULT = {
+    "score": 50.0,
+    "communication_score": 70.0,
+    "confidence_score": 70.0,
+    "relevance_score": 50.0,
+    "depth_score": 50.0,
+    "star_method_score": 0.0,
+    "feedback": "No answer provided for behavioral analysis."
+}
+
 class BehavioralEngine:
     def __init__(self):
         self.sentiment_analyzer = None
@@ -35,15 +51,7 @@ class BehavioralEngine:
         """Analyze behavioral content and metrics"""
         # Default scores if no answer provided
         if not answer or not answer.strip():
-            return {
-                "score": 50.0,
-                "communication_score": 70.0,
-                "confidence_score": 70.0,
-                "relevance_score": 50.0,
-                "depth_score": 50.0,
-                "star_method_score": 0.0,
-                "feedback": "No answer provided for behavioral analysis."
-            }
+            return dict(_EMPTY_ANSWER_RESULT)
 
         # Initialize models if needed
         self._initialize_models()
@@ -52,14 +60,16 @@ class BehavioralEngine:
         relevance_score = self._calculate_relevance(question, answer) if question else 0.5
 
         # Analyze sentiment/confidence using Hugging Face
-        sentiment = llm_service.analyze_sentiment(answer[:512])
+        # One keyword scan feeds sentiment, depth and STAR detection
+        hits = scan_answer(answer)
+        sentiment = basic_sentiment(answer, hits, within=512)
         confidence_score = self._map_sentiment_to_confidence(sentiment)
 
         # Enhanced behavioral depth analysis
-        behavioral_depth = self._analyze_behavioral_depth(answer)
+        behavioral_depth = self._analyze_behavioral_depth(answer, hits)
 
         # STAR method detection
-        star_score = self._detect_star_method(answer)
+        star_score = self._detect_star_method(answer, hits)
 
         # Analyze speech metrics if provided
         speech_metrics = self._analyze_speech_metrics(metrics or {})
@@ -86,17 +96,104 @@ class BehavioralEngine:
             )
         }
 
+    def analyze_behavioral_batch(self, questions: list, answers: list, metrics: list = None) -> list:
+        """
+        Batch version of analyze_behavioral for reports and re-scoring.
+
+        Each answer's features come from the same helpers as analyze_behavioral
+        (one keyword scan per answer feeds sentiment, depth and STAR); the
+        speech and combined score arithmetic then runs on NumPy arrays for the
+        whole batch. Returns the same dicts as calling analyze_behavioral on
+        each (question, answer, metrics) triple.
+        """
+        if len(questions) != len(answers):
+            raise ValueError("questions and answers must have the same length")
+        metrics = list(metrics) if metrics is not None else [None] * len(answers)
+        if len(metrics) != len(answers):
+            raise ValueError("metrics must have the same length as answers")
+
+        results = []
+        live = []
+        for i, answer in enumerate(answers):
+            if answer and answer.strip():
+                live.append(i)
+                results.append(None)
+            else:
+                results.append(dict(_EMPTY_ANSWER_RESULT))
+        if not live:
+            return results
+
+        self._initialize_models()
+        n = len(live)
+        # relevance, depth, confidence, star
+        features = np.empty((n, 4))
+        speech_inputs = np.empty((n, 4))             # filler, pauses, rate, eye contact
+
+        for row, i in enumerate(live):
+            answer = answers[i]
+            hits = scan_answer(answer)
+            features[row] = (
+                self._calculate_relevance(questions[i], answer) if questions[i] else 0.5,
+                self._analyze_behavioral_depth(answer, hits),
+                self._map_sentiment_to_confidence(basic_sentiment(answer, hits, within=512)),
+                self._detect_star_method(answer, hits),
+            )
+            m = metrics[i] or {}
+            speech_inputs[row] = (
+                m.get('filler_words', 0),
+                m.get('pause_count', 0),
+                m.get('speech_rate', 150),
+                m.get('eye_contact', 0.7),
+            )
+        relevance_arr, depth, confidence_arr, star = features.T
+
+        # Speech, same steps as _analyze_speech_metrics
+        filler, pauses, rate, eye = speech_inputs.T
+        comm = 1.0 - np.minimum(filler * 0.03, 0.3)
+        comm = comm - np.minimum(pauses * 0.02, 0.2)
+        comm = comm - np.where((rate < 100) | (rate > 200), 0.1, 0.0)
+        comm = np.clip(comm, 0, 1.0)
+        speech_overall = (comm + eye) / 2
+
+        behavioral = (
+            relevance_arr * 0.3 +
+            depth * 0.25 +
+            confidence_arr * 0.2 +
+            star * 0.15 +
+            speech_overall * 0.1
+        ) * 100
+
+        for row, i in enumerate(live):
+            m = metrics[i] or {}
+            speech_metrics = {
+                'communication': float(comm[row]),
+                'eye_contact': m.get('eye_contact', 0.7),
+                'speech_rate': m.get('speech_rate', 150),
+                'filler_words': m.get('filler_words', 0),
+                'pause_count': m.get('pause_count', 0),
+                'overall': float(speech_overall[row])
+            }
+            score = float(behavioral[row])
+            results[i] = {
+                "score": round(score, 2),
+                "communication_score": round(float(comm[row]) * 100, 2),
+                "confidence_score": round(float(confidence_arr[row]) * 100, 2),
+                "relevance_score": round(float(relevance_arr[row]) * 100, 2),
+                "depth_score": round(float(depth[row]) * 100, 2),
+                "star_method_score": round(float(star[row]) * 100, 2),
+                "speech_metrics": speech_metrics,
+                "feedback": self._generate_behavioral_feedback(
+                    score, answers[i], float(star[row]), speech_metrics
+                )
+            }
+        return results
+
     def _calculate_relevance(self, question: str, answer: str) -> float:
-        """Calculate relevance using simple keyword matching (deprecated similarity model)"""
+        """Calculate relevance with hashed n-gram vector similarity (no model needed)"""
         self._initialize_models()
-        # Simple keyword-based relevance as fallback
         try:
-            question_words = set(question.lower().split())
-            answer_words = set(answer.lower().split())
-            common_words = question_words.intersection(answer_words)
-            # Simple relevance score based on common words
-            relevance = min(1.0, len(common_words) / max(1, len(question_words)) * 2)
-            return max(0.3, relevance)  # Minimum 0.3 relevance
+            score = relevance(vectorize_cached(question), answer)
+            return max(0.3, score)  # Minimum 0.3 relevance
         except Exception as e:
             logger.error(f"Error calculating relevance: {e}")
             return 0.5
@@ -113,14 +210,14 @@ class BehavioralEngine:
         else:
             return 0.5
 
-    def _analyze_behavioral_depth(self, answer: str) -> float:
+    def _analyze_behavioral_depth(self, answer: str, hits: KeywordHits = None) -> float:
         """Analyze depth of behavioral response"""
         word_count = len(answer.split())
 
-        # Check for specific examples and details
-        has_specifics = len(re.findall(r'\b\d+\b|\b[A-Z][a-z]+\b.*\b\d{4}\b', answer)) > 0
-        has_metrics = len(re.findall(r'\d+%|\d+ people|\$\d+', answer)) > 0
-        has_outcomes = len(re.findall(r'result|outcome|achieved|improved|increased|decreased', answer.lower())) > 0
+        # Check for specific examples and details (search stops at the first hit)
+        has_specifics = _SPECIFICS_RE.search(answer) is not None
+        has_metrics = _METRICS_RE.search(answer) is not None
+        has_outcomes = (hits or scan_answer(answer)).any('outcome')
 
         depth_score = min(word_count / 100, 1.0)
         if has_specifics:
@@ -132,25 +229,10 @@ class BehavioralEngine:
 
         return min(depth_score, 1.0)
 
-    def _detect_star_method(self, answer: str) -> float:
+    def _detect_star_method(self, answer: str, hits: KeywordHits = None) -> float:
         """Detect usage of STAR method (Situation, Task, Action, Result)"""
-        answer_lower = answer.lower()
-
-        situation_keywords = ['situation', 'background', 'context', 'when', 'at that time']
-        task_keywords = ['task', 'responsibility', 'role', 'expected to', 'needed to']
-        action_keywords = ['action', 'did', 'implemented', 'used', 'applied', 'took']
-        result_keywords = ['result', 'outcome', 'achieved', 'learned', 'improved']
-
-        star_components = 0
-        if any(word in answer_lower for word in situation_keywords):
-            star_components += 1
-        if any(word in answer_lower for word in task_keywords):
-            star_components += 1
-        if any(word in answer_lower for word in action_keywords):
-            star_components += 1
-        if any(word in answer_lower for word in result_keywords):
-            star_components += 1
-
+        hits = hits or scan_answer(answer)
+        star_components = sum(1 for lexicon in STAR_LEXICONS if hits.any(lexicon))
         return star_components / 4.0  # Normalize to 0-1
 
     def _analyze_speech_metrics(self, metrics: dict) -> dict:
@@ -9,15 +9,37 @@ IMPORTANT: Uses the correct OpenRouter API URL:
     https://openrouter.ai/api/v1/chat/completions
 """
 
+import asyncio
 import json
 import hashlib
 import os
+import sqlite3
+import threading
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
 
-import requests
+import httpx
 
 from app.config import get_settings
+from app.utils.cache import LRUTTLCache, SQLiteCache
+from app.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+from app.utils.concurrency import (
+    AsyncSingleFlight,
+    GovernorTimeout,
+    RateGovernor,
+    SingleFlight,
+)
+from app.utils.hedging import HedgeBudget, LatencyTracker
+from app.utils.json_stream import JSONArrayStreamParser
+from app.utils.retry import RetryPolicy, parse_retry_after
+from app.utils.tokens import PromptTokenStats, compact_text, estimate_message_tokens
+
+try:
+    import h2  # noqa: F401  (optional: enables HTTP/2 on the pooled client)
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
 
 settings = get_settings()
 
@@ -46,8 +68,169 @@ else:
     print(f"✅ OpenRouter API key loaded (model: {OPENROUTER_MODEL})")
     print(f"   Using base URL: {OPENROUTER_BASE}")
 
-# In-memory cache with TTL
-CACHE: Dict[str, Dict[str, Any]] = {}
+T = TypeVar("T")
+
+# Bounded in-memory LRU cache with TTL
+CACHE = LRUTTLCache(
+    max_entries=settings.OPENROUTER_CACHE_MAX_ENTRIES,
+    max_bytes=settings.OPENROUTER_CACHE_MAX_BYTES,
+    ttl_seconds=settings.OPENROUTER_CACHE_TTL,
+)
+
+# Optional on-disk tier behind CACHE, shared across workers and restarts
+DISK_CACHE: Optional[SQLiteCache] = None
+if settings.OPENROUTER_DISK_CACHE_PATH:
+    try:
+        DISK_CACHE = SQLiteCache(
+            settings.OPENROUTER_DISK_CACHE_PATH,
+            max_entries=settings.OPENROUTER_DISK_CACHE_MAX_ENTRIES,
+            max_bytes=settings.OPENROUTER_DISK_CACHE_MAX_BYTES,
+            ttl_seconds=settings.OPENROUTER_DISK_CACHE_TTL,
+        )
+        print(f"✅ Persistent LLM cache: {settings.OPENROUTER_DISK_CACHE_PATH}")
+    except (sqlite3.Error, OSError) as e:
+        print(f"⚠️ Could not open persistent LLM cache: {e}")
+
+
+# Transient upstream failures (429/5xx/transport) are retried with jitter
+RETRY_POLICY = RetryPolicy(
+    max_attempts=settings.OPENROUTER_MAX_ATTEMPTS,
+    base_delay=settings.OPENROUTER_RETRY_BASE_DELAY,
+    max_delay=settings.OPENROUTER_RETRY_MAX_DELAY,
+)
+
+# Trips on upstream errors/slow calls so requests fail over to fallbacks instantly
+BREAKER = CircuitBreaker(
+    window=settings.OPENROUTER_BREAKER_WINDOW,
+    min_calls=settings.OPENROUTER_BREAKER_MIN_CALLS,
+    failure_rate=settings.OPENROUTER_BREAKER_FAILURE_RATE,
+    slow_call_seconds=settings.OPENROUTER_BREAKER_SLOW_CALL_SECONDS,
+    reset_seconds=settings.OPENROUTER_BREAKER_RESET_SECONDS,
+    half_open_calls=settings.OPENROUTER_BREAKER_HALF_OPEN_CALLS,
+)
+
+# Opt-in hedging for evaluate_answer: duplicate slow requests within a budget
+EVALUATION_LATENCY = LatencyTracker()
+HEDGE_BUDGET = HedgeBudget(settings.OPENROUTER_HEDGE_BUDGET)
+
+# Estimated prompt size of every request sent upstream
+PROMPT_TOKENS = PromptTokenStats()
+
+# Identical requests in flight share one upstream call (keyed by cache key)
+_inflight = SingleFlight()
+_inflight_async = AsyncSingleFlight()
+
+# Client-side rate limit + concurrency cap for upstream calls
+GOVERNOR = RateGovernor(
+    rate_per_second=settings.OPENROUTER_RATE_LIMIT_PER_SEC,
+    burst=settings.OPENROUTER_RATE_LIMIT_BURST,
+    max_concurrency=settings.OPENROUTER_MAX_CONCURRENCY,
+    max_wait=settings.OPENROUTER_QUEUE_TIMEOUT,
+)
+
+
+# --------------------------------------------------------------------
+# Pooled HTTP transport
+# --------------------------------------------------------------------
+_http_client: Optional[httpx.Client] = None
+_http_client_lock = threading.Lock()
+_async_http_client: Optional[httpx.AsyncClient] = None
+_async_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+_async_http_client_guard: Optional["asyncio.Task[None]"] = None
+
+
+def _default_headers() -> Dict[str, str]:
+    return {
+        "Authorization": f"Bearer {OPENROUTER_API_KEY}",
+        "Content-Type": "application/json",
+        # Optional for OpenRouter analytics
+        "HTTP-Referer": "https://github.com/your-repo",
+        "X-Title": "AI Mock Interview Simulator",
+    }
+
+
+def _pool_limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=settings.OPENROUTER_POOL_SIZE,
+        max_keepalive_connections=settings.OPENROUTER_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=settings.OPENROUTER_KEEPALIVE_EXPIRY,
+    )
+
+
+def get_http_client() -> httpx.Client:
+    """
+    Return the worker-wide pooled client, creating it on first use.
+
+    Connections are kept alive between calls so evaluation, improvement and
+    question generation reuse warm TCP/TLS sessions to OpenRouter.
+    """
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                _http_client = httpx.Client(
+                    http2=settings.OPENROUTER_HTTP2 and HTTP2_AVAILABLE,
+                    limits=_pool_limits(),
+                    headers=_default_headers(),
+                )
+    return _http_client
+
+
+async def _close_with_loop(client: httpx.AsyncClient) -> None:
+    """Park until the owning loop shuts down, then close ``client`` on it."""
+    try:
+        await asyncio.get_running_loop().create_future()
+    finally:
+        await client.aclose()
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """
+    Return the pooled asyncio client used by the ``*_async`` helpers.
+
+    The pool is bound to the running event loop. A guard task closes it when
+    that loop shuts down (``asyncio.run`` cancels leftover tasks), so a new
+    loop never inherits or leaks the previous loop's connections.
+    """
+    global _async_http_client, _async_http_client_loop, _async_http_client_guard
+    loop = asyncio.get_running_loop()
+    if _async_http_client is None or _async_http_client_loop is not loop:
+        previous, previous_loop = _async_http_client, _async_http_client_loop
+        if previous is not None and not previous.is_closed:
+            if previous_loop is not None and previous_loop.is_running():
+                # Still serving another thread: close it on its own loop.
+                asyncio.run_coroutine_threadsafe(previous.aclose(), previous_loop)
+            else:
+                print("⚠️ Previous async HTTP client was left open by a stopped event loop")
+        _async_http_client_loop = loop
+        _async_http_client = httpx.AsyncClient(
+            http2=settings.OPENROUTER_HTTP2 and HTTP2_AVAILABLE,
+            limits=_pool_limits(),
+            headers=_default_headers(),
+        )
+        _async_http_client_guard = loop.create_task(_close_with_loop(_async_http_client))
+    return _async_http_client
+
+
+def close_http_clients() -> None:
+    """Close pooled sync connections."""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is not None:
+            _http_client.close()
+            _http_client = None
+
+
+async def aclose_http_clients() -> None:
+    """Close all pooled connections (called on app shutdown)."""
+    global _async_http_client, _async_http_client_guard
+    if _async_http_client_guard is not None:
+        _async_http_client_guard.cancel()
+        _async_http_client_guard = None
+    if _async_http_client is not None:
+        await _async_http_client.aclose()
+        _async_http_client = None
+    close_http_clients()
 
 
 # --------------------------------------------------------------------
@@ -57,18 +240,255 @@ def _get_cache_key(
     messages: List[Dict[str, str]],
     temperature: float,
     max_tokens: int,
+    model: Optional[str] = None,
 ) -> str:
-    """Generate SHA256 cache key from messages + basic params."""
+    """Generate SHA256 cache key from messages + basic params (+ model, if not the default)."""
     payload = {
         "messages": messages,
         "temperature": temperature,
         "max_tokens": max_tokens,
     }
+    if model and model != OPENROUTER_MODEL:
+        payload["model"] = model
     return hashlib.sha256(
         json.dumps(payload, sort_keys=True).encode("utf-8")
     ).hexdigest()
 
 
+def _cache_get(cache_key: str, persistent: bool = False) -> Optional[str]:
+    """Look up memory first, then (for deterministic prompts) the disk tier."""
+    text = CACHE.get(cache_key)
+    if text is None and persistent and DISK_CACHE is not None:
+        text = DISK_CACHE.get(cache_key)
+        if text is not None:
+            CACHE.set(cache_key, text)
+    return text
+
+
+def _cache_put(cache_key: str, text: str, persistent: bool = False) -> None:
+    CACHE.set(cache_key, text)
+    if persistent and DISK_CACHE is not None:
+        DISK_CACHE.set(cache_key, text)
+
+
+async def _cache_get_async(cache_key: str, persistent: bool = False) -> Optional[str]:
+    """``_cache_get`` with the SQLite tier read in a worker thread, off the event loop."""
+    text = CACHE.get(cache_key)
+    if text is None and persistent and DISK_CACHE is not None:
+        text = await asyncio.to_thread(DISK_CACHE.get, cache_key)
+        if text is not None:
+            CACHE.set(cache_key, text)
+    return text
+
+
+async def _cache_put_async(cache_key: str, text: str, persistent: bool = False) -> None:
+    CACHE.set(cache_key, text)
+    if persistent and DISK_CACHE is not None:
+        await asyncio.to_thread(DISK_CACHE.set, cache_key, text)
+
+
+def _build_payload(
+    messages: List[Dict[str, str]],
+    temperature: float,
+    max_tokens: int,
+    model: Optional[str] = None,
+) -> Dict[str, Any]:
+    model = model or OPENROUTER_MODEL
+    prompt_tokens = estimate_message_tokens(messages)
+    PROMPT_TOKENS.record(prompt_tokens)
+    print(
+        f"🔄 OpenRouter request: POST {OPENROUTER_BASE} "
+        f"(model: {model}, prompt≈{prompt_tokens}, tokens: {max_tokens}, temp: {temperature})"
+    )
+    return {
+        "model": model,
+        "messages": messages,
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+    }
+
+
+def _read_completion(resp: httpx.Response) -> Optional[str]:
+    """
+    Extract assistant text from an OpenRouter response.
+
+    Returns None when the body is not JSON (e.g. an HTML error page), which
+    must not be cached. Raises on HTTP errors and undecodable JSON.
+    """
+    resp.raise_for_status()
+
+    # If it's clearly HTML, don't even try to json.loads
+    content_type = resp.headers.get("Content-Type", "")
+    if "application/json" not in content_type:
+        body_preview = resp.text[:400]
+        print("❌ OpenRouter returned non-JSON response.")
+        print(f"   Body (first 400 chars): {body_preview!r}")
+        return None
+
+    data = resp.json()
+
+    # Extract assistant message
+    if "choices" in data and data["choices"]:
+        return data["choices"][0].get("message", {}).get("content", "").strip()
+
+    print(f"⚠️ Unexpected OpenRouter response JSON: {data}")
+    return ""
+
+
+def _log_call_error(e: Exception, resp: Optional[httpx.Response]) -> None:
+    if isinstance(e, CircuitOpenError):
+        print("⚡ OpenRouter circuit open; using fallback")
+    elif isinstance(e, GovernorTimeout):
+        print(f"⏳ OpenRouter request not sent (client-side limit): {e}")
+    elif isinstance(e, httpx.HTTPError):
+        print(f"❌ OpenRouter API error: {e}")
+    elif isinstance(e, json.JSONDecodeError):
+        print(f"❌ JSON decode error from OpenRouter: {e}")
+        body_preview = resp.text[:400] if resp is not None else ""
+        print(f"   Raw body (first 400 chars): {body_preview!r}")
+    else:
+        print(f"❌ Unexpected OpenRouter error: {e}")
+
+
+def _enter_breaker() -> float:
+    """Reserve a breaker slot for one upstream attempt; returns its start time."""
+    if not BREAKER.allow_request():
+        raise CircuitOpenError()
+    return time.monotonic()
+
+
+def _record_outcome(started: float, resp: Optional[httpx.Response]) -> None:
+    """Feed one attempt into the breaker: no response, 429 or 5xx count as failures."""
+    latency = time.monotonic() - started
+    if resp is None or resp.status_code == 429 or resp.status_code >= 500:
+        BREAKER.record_failure(latency)
+    else:
+        BREAKER.record_success(latency)
+
+
+def _error_label(e: Exception) -> str:
+    if isinstance(e, httpx.HTTPStatusError):
+        return f"HTTP {e.response.status_code}"
+    return type(e).__name__
+
+
+def _retry_delay(
+    e: Exception,
+    resp: Optional[httpx.Response],
+    attempt: int,
+    previous: float,
+    deadline: float,
+) -> Optional[float]:
+    """Backoff before the next attempt, or None if ``e`` is final."""
+    retry_after = None
+    if isinstance(e, httpx.HTTPStatusError):
+        if not RETRY_POLICY.is_retryable_status(e.response.status_code):
+            return None
+        retry_after = parse_retry_after(e.response.headers.get("Retry-After"))
+    elif not isinstance(e, httpx.TransportError):
+        return None
+    return RETRY_POLICY.delay_for(
+        attempt, previous, deadline - time.monotonic(), retry_after
+    )
+
+
+def _request_completion(
+    cache_key: str,
+    messages: List[Dict[str, str]],
+    temperature: float,
+    max_tokens: int,
+    timeout: int,
+    persistent: bool,
+    model: Optional[str] = None,
+) -> str:
+    payload = _build_payload(messages, temperature, max_tokens, model)
+
+    # ``timeout`` bounds the whole call, retries and backoff included
+    deadline = time.monotonic() + timeout
+    delay = RETRY_POLICY.base_delay
+    attempt = 0
+    while True:
+        attempt += 1
+        resp: Optional[httpx.Response] = None
+        try:
+            with GOVERNOR.acquire(deadline):
+                started = _enter_breaker()
+                try:
+                    resp = get_http_client().post(
+                        OPENROUTER_BASE,
+                        json=payload,
+                        timeout=max(0.1, deadline - time.monotonic()),
+                    )
+                finally:
+                    _record_outcome(started, resp)
+            text = _read_completion(resp)
+            break
+        except Exception as e:
+            wait = _retry_delay(e, resp, attempt, delay, deadline)
+            if wait is None:
+                _log_call_error(e, resp)
+                return ""
+            print(f"🔁 OpenRouter attempt {attempt} failed ({_error_label(e)}); retrying in {wait:.1f}s")
+            time.sleep(wait)
+            delay = wait
+
+    if text is None:
+        return ""
+    _cache_put(cache_key, text, persistent)
+    return text
+
+
+async def _request_completion_async(
+    cache_key: str,
+    messages: List[Dict[str, str]],
+    temperature: float,
+    max_tokens: int,
+    timeout: int,
+    persistent: bool,
+    model: Optional[str] = None,
+) -> str:
+    payload = _build_payload(messages, temperature, max_tokens, model)
+
+    deadline = time.monotonic() + timeout
+    delay = RETRY_POLICY.base_delay
+    attempt = 0
+    while True:
+        attempt += 1
+        resp: Optional[httpx.Response] = None
+        try:
+            async with GOVERNOR.acquire_async(deadline):
+                started = _enter_breaker()
+                try:
+                    resp = await get_async_http_client().post(
+                        OPENROUTER_BASE,
+                        json=payload,
+                        timeout=max(0.1, deadline - time.monotonic()),
+                    )
+                except asyncio.CancelledError:
+                    # Caller gave up (deadline or lost hedge): not an upstream failure
+                    BREAKER.record_cancelled()
+                    raise
+                except Exception:
+                    _record_outcome(started, None)
+                    raise
+                _record_outcome(started, resp)
+            text = _read_completion(resp)
+            break
+        except Exception as e:
+            wait = _retry_delay(e, resp, attempt, delay, deadline)
+            if wait is None:
+                _log_call_error(e, resp)
+                return ""
+            print(f"🔁 OpenRouter attempt {attempt} failed ({_error_label(e)}); retrying in {wait:.1f}s")
+            await asyncio.sleep(wait)
+            delay = wait
+
+    if text is None:
+        return ""
+    await _cache_put_async(cache_key, text, persistent)
+    return text
+
+
 def call_openrouter(
     messages: List[Dict[str, str]],
     temperature: float = 0.0,
@@ -78,75 +498,289 @@ def call_openrouter(
     """
     Call OpenRouter and return raw assistant text.
 
-    Single, clean HTTP call.
+    Single, clean HTTP call over the pooled keep-alive client. Identical
+    requests already in flight are coalesced onto that one upstream call.
+    Transient failures are retried; ``timeout`` caps the total time spent.
     """
     if not OPENROUTER_API_KEY:
         print("⚠️ OPENROUTER_API_KEY not configured")
         return ""
 
     cache_key = _get_cache_key(messages, temperature, max_tokens)
-    now = time.time()
-    cached = CACHE.get(cache_key)
-    if cached and now - cached["ts"] < 3600:  # 1 hour TTL
-        return cached["out"]
+    # Only temperature=0 completions are reproducible enough to persist
+    persistent = temperature == 0
+    cached = _cache_get(cache_key, persistent)
+    if cached is not None:
+        return cached
+
+    if BREAKER.is_open():
+        # Upstream is failing: let callers use their local fallbacks right away
+        return ""
 
-    headers = {
-        "Authorization": f"Bearer {OPENROUTER_API_KEY}",
-        "Content-Type": "application/json",
-        # Optional for OpenRouter analytics
-        "HTTP-Referer": "https://github.com/your-repo",
-        "X-Title": "AI Mock Interview Simulator",
-    }
+    return _inflight.do(
+        cache_key,
+        lambda: _request_completion(
+            cache_key, messages, temperature, max_tokens, timeout, persistent
+        ),
+    )
 
-    payload = {
-        "model": OPENROUTER_MODEL,
-        "messages": messages,
-        "temperature": temperature,
-        "max_tokens": max_tokens,
-    }
 
-    print(
-        f"🔄 OpenRouter request: POST {OPENROUTER_BASE} "
-        f"(model: {OPENROUTER_MODEL}, tokens: {max_tokens}, temp: {temperature})"
+async def call_openrouter_async(
+    messages: List[Dict[str, str]],
+    temperature: float = 0.0,
+    max_tokens: int = 600,
+    timeout: int = 30,
+) -> str:
+    """
+    Async twin of :func:`call_openrouter`.
+
+    Awaits the upstream call on the event loop instead of holding a
+    threadpool thread for the whole round trip.
+    """
+    if not OPENROUTER_API_KEY:
+        print("⚠️ OPENROUTER_API_KEY not configured")
+        return ""
+
+    cache_key = _get_cache_key(messages, temperature, max_tokens)
+    persistent = temperature == 0
+    cached = await _cache_get_async(cache_key, persistent)
+    if cached is not None:
+        return cached
+
+    if BREAKER.is_open():
+        # Upstream is failing: let callers use their local fallbacks right away
+        return ""
+
+    return await _inflight_async.do(
+        cache_key,
+        lambda: _request_completion_async(
+            cache_key, messages, temperature, max_tokens, timeout, persistent
+        ),
     )
 
+
+async def _call_hedged_async(
+    messages: List[Dict[str, str]],
+    temperature: float = 0.0,
+    max_tokens: int = 600,
+    timeout: int = 30,
+) -> str:
+    """
+    Hedged variant of :func:`call_openrouter_async` for JSON-returning prompts.
+
+    If the primary request is still running after the recent
+    OPENROUTER_HEDGE_PERCENTILE latency, a duplicate is sent (optionally to
+    OPENROUTER_HEDGE_MODEL) while the hedge budget allows. The first
+    response that parses as a JSON object wins and the other is cancelled.
+    Both bypass single-flight so the loser can actually be cancelled.
+    """
+    if not OPENROUTER_API_KEY:
+        print("⚠️ OPENROUTER_API_KEY not configured")
+        return ""
+
+    cache_key = _get_cache_key(messages, temperature, max_tokens)
+    persistent = temperature == 0
+    cached = await _cache_get_async(cache_key, persistent)
+    if cached is not None:
+        return cached
+
+    if BREAKER.is_open():
+        return ""
+
+    HEDGE_BUDGET.record_request()
+    started = time.monotonic()
+    primary = asyncio.ensure_future(
+        _request_completion_async(
+            cache_key, messages, temperature, max_tokens, timeout, persistent
+        )
+    )
+    pending = {primary}
+    text = ""
     try:
-        resp = requests.post(
-            OPENROUTER_BASE, headers=headers, json=payload, timeout=timeout
+        delay = EVALUATION_LATENCY.percentile(
+            settings.OPENROUTER_HEDGE_PERCENTILE, settings.OPENROUTER_HEDGE_DELAY
         )
-        resp.raise_for_status()
-
-        # If it's clearly HTML, don't even try to json.loads
-        content_type = resp.headers.get("Content-Type", "")
-        if "application/json" not in content_type:
-            body_preview = resp.text[:400]
-            print("❌ OpenRouter returned non-JSON response.")
-            print(f"   Body (first 400 chars): {body_preview!r}")
-            return ""
-
-        data = resp.json()
-
-        # Extract assistant message
-        if "choices" in data and data["choices"]:
-            text = data["choices"][0].get("message", {}).get("content", "").strip()
-        else:
-            print(f"⚠️ Unexpected OpenRouter response JSON: {data}")
-            text = ""
-
-        CACHE[cache_key] = {"out": text, "ts": now}
+        done, _ = await asyncio.wait(pending, timeout=delay)
+        if not done and HEDGE_BUDGET.try_acquire():
+            print(f"🪁 Evaluation slower than {delay:.1f}s; sending hedged request")
+            hedge_model = settings.OPENROUTER_HEDGE_MODEL
+            pending.add(
+                asyncio.ensure_future(
+                    _request_completion_async(
+                        # Another model's answer is cached under that model's key,
+                        # never served later as the primary's
+                        _get_cache_key(messages, temperature, max_tokens, hedge_model),
+                        messages,
+                        temperature,
+                        max_tokens,
+                        max(1, int(timeout - delay)),
+                        persistent,
+                        hedge_model,
+                    )
+                )
+            )
+
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                result = task.result()
+                if isinstance(_parse_json_from_text(result), dict):
+                    if task is not primary:
+                        HEDGE_BUDGET.record_hedge_win()
+                    EVALUATION_LATENCY.record(time.monotonic() - started)
+                    return result
+                text = text or result
         return text
+    finally:
+        for task in pending:
+            task.cancel()
 
-    except requests.exceptions.RequestException as e:
-        print(f"❌ OpenRouter API error: {e}")
-        return ""
-    except json.JSONDecodeError as e:
-        print(f"❌ JSON decode error from OpenRouter: {e}")
-        body_preview = resp.text[:400] if "resp" in locals() else ""
-        print(f"   Raw body (first 400 chars): {body_preview!r}")
-        return ""
-    except Exception as e:
-        print(f"❌ Unexpected OpenRouter error: {e}")
-        return ""
+
+async def _stream_completion_async(
+    cache_key: str,
+    messages: List[Dict[str, str]],
+    temperature: float,
+    max_tokens: int,
+    timeout: int,
+    persistent: bool,
+    on_chunk: Callable[[Optional[str]], None],
+) -> str:
+    """
+    Run one upstream streamed completion, passing each delta to ``on_chunk``.
+
+    Failures before the first chunk are retried like ``_request_completion_async``;
+    once text has been relayed the stream cannot be restarted, so a later
+    error just ends it. ``on_chunk(None)`` marks the end. Returns the full
+    text, which is also cached.
+    """
+    payload = _build_payload(messages, temperature, max_tokens)
+    payload["stream"] = True
+
+    parts: List[str] = []
+    deadline = time.monotonic() + timeout
+    delay = RETRY_POLICY.base_delay
+    attempt = 0
+    try:
+        while True:
+            attempt += 1
+            resp: Optional[httpx.Response] = None
+            try:
+                async with GOVERNOR.acquire_async(deadline):
+                    started = _enter_breaker()
+                    try:
+                        async with get_async_http_client().stream(
+                            "POST",
+                            OPENROUTER_BASE,
+                            json=payload,
+                            timeout=max(0.1, deadline - time.monotonic()),
+                        ) as resp:
+                            _record_outcome(started, resp)
+                            resp.raise_for_status()
+                            async for line in resp.aiter_lines():
+                                # SSE: "data: {...}" events, ": comment" keep-alives, "data: [DONE]"
+                                if not line.startswith("data:"):
+                                    continue
+                                data = line[5:].strip()
+                                if data == "[DONE]":
+                                    break
+                                choices = json.loads(data).get("choices") or [{}]
+                                chunk = (choices[0].get("delta") or {}).get("content")
+                                if chunk:
+                                    parts.append(chunk)
+                                    on_chunk(chunk)
+                    except asyncio.CancelledError:
+                        if resp is None:
+                            BREAKER.record_cancelled()
+                        raise
+                    except Exception:
+                        if resp is None:
+                            _record_outcome(started, None)
+                        raise
+                break
+            except Exception as e:
+                wait = None if parts else _retry_delay(e, resp, attempt, delay, deadline)
+                if wait is None:
+                    _log_call_error(e, None)
+                    break
+                print(f"🔁 OpenRouter stream attempt {attempt} failed ({_error_label(e)}); retrying in {wait:.1f}s")
+                await asyncio.sleep(wait)
+                delay = wait
+    finally:
+        on_chunk(None)
+
+    text = "".join(parts).strip()
+    if text:
+        await _cache_put_async(cache_key, text, persistent)
+    return text
+
+
+async def stream_openrouter_async(
+    messages: List[Dict[str, str]],
+    temperature: float = 0.0,
+    max_tokens: int = 600,
+    timeout: int = 30,
+) -> AsyncIterator[str]:
+    """
+    Stream assistant text deltas from OpenRouter (``stream: true``, SSE).
+
+    Yields content chunks as they arrive and caches the full text at the
+    end. A cache hit is yielded as a single chunk. The upstream stream runs
+    under the same single-flight as :func:`call_openrouter_async`: identical
+    requests already in flight (streamed or not) are joined and their full
+    text is yielded as one chunk once ready. Failures before the first chunk
+    are retried; other errors end the stream early (possibly without any
+    chunk), so callers supply their own fallback.
+    """
+    if not OPENROUTER_API_KEY:
+        print("⚠️ OPENROUTER_API_KEY not configured")
+        return
+
+    cache_key = _get_cache_key(messages, temperature, max_tokens)
+    persistent = temperature == 0
+    cached = await _cache_get_async(cache_key, persistent)
+    if cached is not None:
+        yield cached
+        return
+
+    if BREAKER.is_open():
+        return
+
+    chunks: "asyncio.Queue[Optional[str]]" = asyncio.Queue()
+    task, leader = _inflight_async.start(
+        cache_key,
+        lambda: _stream_completion_async(
+            cache_key, messages, temperature, max_tokens, timeout, persistent, chunks.put_nowait
+        ),
+    )
+    if not leader:
+        text = await asyncio.shield(task)
+        if text:
+            yield text
+        return
+
+    # The upstream call runs in its own task, so it completes (and is cached
+    # for any followers) even if this consumer stops early
+    while True:
+        chunk = await chunks.get()
+        if chunk is None:
+            break
+        yield chunk
+
+
+def get_llm_metrics() -> Dict[str, Any]:
+    """Cache, coalescing and rate-governor counters for this worker."""
+    return {
+        "cache": CACHE.stats(),
+        "disk_cache": DISK_CACHE.stats() if DISK_CACHE is not None else None,
+        "coalesced": {
+            "sync": _inflight.coalesced,
+            "async": _inflight_async.coalesced,
+        },
+        "governor": GOVERNOR.stats(),
+        "breaker": BREAKER.stats(),
+        "hedging": HEDGE_BUDGET.stats(),
+        "prompt_tokens": PROMPT_TOKENS.stats(),
+    }
 
 
 # --------------------------------------------------------------------
@@ -194,19 +828,16 @@ def _parse_json_from_text(text: str) -> Optional[Any]:
 # --------------------------------------------------------------------
 # Question + Ideal Answer Generation
 # --------------------------------------------------------------------
-def generate_questions_from_profile(
+def _profile_role(profile: Dict[str, Any]) -> str:
+    return profile.get("role", profile.get("estimated_role", "Software Engineer"))
+
+
+def _build_question_messages(
     profile: Dict[str, Any],
     persona: str,
     interview_type: str,
-) -> List[Dict[str, Any]]:
-    """
-    Generate exactly 7 interview questions using OpenRouter.
-
-    Each question dict includes:
-    id, text, followups, type, difficulty, expected_keywords,
-    expected_length, ideal_answer (reference answer).
-    """
-    role = profile.get("role", profile.get("estimated_role", "Software Engineer"))
+) -> List[Dict[str, str]]:
+    role = _profile_role(profile)
     skills = profile.get("skills", [])
     experience = profile.get("experience", {})
 
@@ -250,36 +881,112 @@ Rules:
 - expected_keywords must be concise.
 - Output ONLY a JSON array of question objects."""
     
-    messages = [
+    return [
         {"role": "system", "content": system_prompt},
         {"role": "user",  "content": user_prompt},
     ]
 
-    text = call_openrouter(messages, temperature=0.0, max_tokens=900)
 
+def _normalize_question(q: Dict[str, Any], index: int, interview_type: str) -> Dict[str, Any]:
+    return {
+        "id": q.get("id", f"q{index + 1}"),
+        "text": q.get("text", q.get("question", "")),
+        "followups": q.get("followups", ""),
+        "type": q.get("type", interview_type),
+        "difficulty": q.get("difficulty", "medium"),
+        "expected_keywords": q.get("expected_keywords", []),
+        "expected_length": q.get("expected_length", "medium"),
+        "ideal_answer": q.get("ideal_answer", ""),
+    }
+
+
+def _parse_questions(
+    text: str,
+    profile: Dict[str, Any],
+    persona: str,
+    interview_type: str,
+) -> List[Dict[str, Any]]:
     if text:
         parsed = _parse_json_from_text(text)
         if isinstance(parsed, list) and len(parsed) >= 7:
             questions: List[Dict[str, Any]] = []
             for i, q in enumerate(parsed[:7]):
                 if isinstance(q, dict):
-                    questions.append(
-                        {
-                            "id": q.get("id", f"q{i + 1}"),
-                            "text": q.get("text", q.get("question", "")),
-                            "followups": q.get("followups", ""),
-                            "type": q.get("type", interview_type),
-                            "difficulty": q.get("difficulty", "medium"),
-                            "expected_keywords": q.get("expected_keywords", []),
-                            "expected_length": q.get("expected_length", "medium"),
-                            "ideal_answer": q.get("ideal_answer", ""),
-                        }
-                    )
+                    questions.append(_normalize_question(q, i, interview_type))
             if len(questions) == 7:
                 return questions
 
     print("⚠️ OpenRouter returned empty/invalid text for question generation. Using fallback.")
-    return _get_fallback_questions(role, interview_type, persona)
+    return _get_fallback_questions(_profile_role(profile), interview_type, persona)
+
+
+def generate_questions_from_profile(
+    profile: Dict[str, Any],
+    persona: str,
+    interview_type: str,
+) -> List[Dict[str, Any]]:
+    """
+    Generate exactly 7 interview questions using OpenRouter.
+
+    Each question dict includes:
+    id, text, followups, type, difficulty, expected_keywords,
+    expected_length, ideal_answer (reference answer).
+    """
+    messages = _build_question_messages(profile, persona, interview_type)
+    text = call_openrouter(messages, temperature=0.0, max_tokens=900)
+    return _parse_questions(text, profile, persona, interview_type)
+
+
+async def generate_questions_from_profile_async(
+    profile: Dict[str, Any],
+    persona: str,
+    interview_type: str,
+) -> List[Dict[str, Any]]:
+    """Async variant of :func:`generate_questions_from_profile`."""
+    messages = _build_question_messages(profile, persona, interview_type)
+    text = await call_openrouter_async(messages, temperature=0.0, max_tokens=900)
+    return _parse_questions(text, profile, persona, interview_type)
+
+
+async def generate_questions_streaming_async(
+    profile: Dict[str, Any],
+    persona: str,
+    interview_type: str,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Yield the 7 questions one by one as the streamed JSON array arrives.
+
+    Each question is yielded as soon as its closing brace is parsed, so the
+    first one is available long before the full completion. If the stream
+    ends early or fails, the remaining slots are filled from the fallback
+    questions, so exactly 7 are always yielded.
+    """
+    messages = _build_question_messages(profile, persona, interview_type)
+    parser = JSONArrayStreamParser()
+    count = 0
+    seen_ids = set()
+    # Drain the whole stream (not just 7 items) so the full completion gets cached
+    async for chunk in stream_openrouter_async(messages, temperature=0.0, max_tokens=900):
+        for item in parser.feed(chunk):
+            if not isinstance(item, dict) or count >= 7:
+                continue
+            question = _normalize_question(item, count, interview_type)
+            seen_ids.add(str(question["id"]))
+            count += 1
+            yield question
+
+    if count < 7:
+        print(f"⚠️ Streamed question generation produced {count}/7 questions. Filling from fallback.")
+        for q in _get_fallback_questions(_profile_role(profile), interview_type, persona):
+            if count >= 7:
+                break
+            if str(q.get("id")) in seen_ids:
+                q = dict(q, id=f"q{count + 1}")
+                if q["id"] in seen_ids:
+                    q["id"] = f"fallback-{count + 1}"
+            seen_ids.add(str(q["id"]))
+            count += 1
+            yield q
 
 
 def _get_fallback_questions(role: str, interview_type: str, persona: str) -> List[Dict[str, Any]]:
@@ -406,16 +1113,17 @@ def _get_fallback_questions(role: str, interview_type: str, persona: str) -> Lis
 # --------------------------------------------------------------------
 # Evaluation
 # --------------------------------------------------------------------
-def evaluate_answer(
+def _compact_ideal_answer(ideal_answer: Optional[str]) -> str:
+    return compact_text(ideal_answer or "", settings.OPENROUTER_IDEAL_ANSWER_TOKENS) or "N/A"
+
+
+def _build_evaluation_messages(
     question_text: str,
     transcript: str,
     expected_keywords: List[str],
     profile: Dict[str, Any],
-    ideal_answer: Optional[str] = None,
-) -> Dict[str, Any]:
-    """
-    Evaluate answer and return compact evaluation JSON.
-    """
+    ideal_answer: Optional[str],
+) -> List[Dict[str, str]]:
     system_prompt = (
         "Return ONLY JSON with keys:\n"
         "technical (0-100),\n"
@@ -431,18 +1139,21 @@ def evaluate_answer(
     }
 
     user_prompt = f"""QUESTION: {question_text}
-IDEAL_ANSWER: {ideal_answer or "N/A"}
-ANSWER: {transcript}
+IDEAL_ANSWER: {_compact_ideal_answer(ideal_answer)}
+ANSWER: {compact_text(transcript, settings.OPENROUTER_TRANSCRIPT_TOKENS)}
 PROFILE: {json.dumps(profile_summary)}
 KEYWORDS: {', '.join(expected_keywords) if expected_keywords else 'N/A'}"""
 
-    messages = [
+    return [
         {"role": "system", "content": system_prompt},
         {"role": "user",  "content": user_prompt},
     ]
 
-    text = call_openrouter(messages, temperature=0.0, max_tokens=220)
 
+_FALLBACK_EVALUATION_NOTES = "Baseline evaluation (OpenRouter not available)."
+
+
+def _parse_evaluation(text: str) -> Dict[str, Any]:
     if text:
         parsed = _parse_json_from_text(text)
         if isinstance(parsed, Dict):
@@ -460,35 +1171,222 @@ KEYWORDS: {', '.join(expected_keywords) if expected_keywords else 'N/A'}"""
         "communication": 70,
         "confidence": 70,
         "relevance": 70,
-        "short_notes": "Baseline evaluation (OpenRouter not available).",
+        "short_notes": _FALLBACK_EVALUATION_NOTES,
     }
 
 
-# --------------------------------------------------------------------
-# Improved Answer
-# --------------------------------------------------------------------
-def improve_answer(
+def is_fallback_evaluation(evaluation: Dict[str, Any]) -> bool:
+    """True if ``evaluation`` is the baseline returned when the LLM gave no usable answer."""
+    return evaluation.get("short_notes") == _FALLBACK_EVALUATION_NOTES
+
+
+def evaluate_answer(
     question_text: str,
     transcript: str,
+    expected_keywords: List[str],
     profile: Dict[str, Any],
-) -> str:
+    ideal_answer: Optional[str] = None,
+) -> Dict[str, Any]:
     """
-    Return a concise improved answer (40–70 words). No JSON.
+    Evaluate answer and return compact evaluation JSON.
     """
+    messages = _build_evaluation_messages(
+        question_text, transcript, expected_keywords, profile, ideal_answer
+    )
+    text = call_openrouter(messages, temperature=0.0, max_tokens=220)
+    return _parse_evaluation(text)
+
+
+async def evaluate_answer_async(
+    question_text: str,
+    transcript: str,
+    expected_keywords: List[str],
+    profile: Dict[str, Any],
+    ideal_answer: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Async variant of :func:`evaluate_answer` (hedged when OPENROUTER_HEDGE_EVALUATION is on)."""
+    messages = _build_evaluation_messages(
+        question_text, transcript, expected_keywords, profile, ideal_answer
+    )
+    call = _call_hedged_async if settings.OPENROUTER_HEDGE_EVALUATION else call_openrouter_async
+    text = await call(messages, temperature=0.0, max_tokens=220)
+    return _parse_evaluation(text)
+
+
+_EVALUATION_SCORES = ("technical", "communication", "confidence", "relevance")
+
+
+def _build_batch_evaluation_messages(
+    items: List[Dict[str, Any]],
+    profile: Dict[str, Any],
+) -> List[Dict[str, str]]:
+    system_prompt = (
+        "Evaluate each numbered answer. Return ONLY a JSON array with one object per answer, keys:\n"
+        "index (the answer number),\n"
+        "technical (0-100),\n"
+        "communication (0-100),\n"
+        "confidence (0-100),\n"
+        "relevance (0-100),\n"
+        "short_notes (<= 40 words)."
+    )
+
+    profile_summary = {
+        "role": profile.get("role", profile.get("estimated_role", "")),
+        "skills": profile.get("skills", [])[:5],
+    }
+
+    blocks = [f"PROFILE: {json.dumps(profile_summary)}"]
+    for i, item in enumerate(items):
+        keywords = item.get("expected_keywords") or []
+        blocks.append(
+            f"""[{i}]
+QUESTION: {item.get("question_text", "")}
+IDEAL_ANSWER: {_compact_ideal_answer(item.get("ideal_answer"))}
+ANSWER: {compact_text(item.get("transcript", ""), settings.OPENROUTER_TRANSCRIPT_TOKENS)}
+KEYWORDS: {', '.join(keywords) if keywords else 'N/A'}"""
+        )
+
+    return [
+        {"role": "system", "content": system_prompt},
+        {"role": "user",  "content": "\n\n".join(blocks)},
+    ]
+
+
+def _parse_batch_evaluation(text: str, count: int) -> List[Optional[Dict[str, Any]]]:
+    """
+    Map an indexed JSON array back onto ``count`` slots.
+
+    Entries with a missing/out-of-range index or a missing or non-numeric
+    score are rejected, leaving their slot None.
+    """
+    results: List[Optional[Dict[str, Any]]] = [None] * count
+    parsed = _parse_json_from_text(text) if text else None
+    if isinstance(parsed, dict):
+        parsed = parsed.get("results") or parsed.get("evaluations")
+    if not isinstance(parsed, list):
+        return results
+
+    for entry in parsed:
+        if not isinstance(entry, dict):
+            continue
+        try:
+            index = int(entry["index"])
+            scores = {key: int(entry[key]) for key in _EVALUATION_SCORES}
+        except (KeyError, TypeError, ValueError):
+            continue
+        if 0 <= index < count and results[index] is None:
+            notes = entry.get("short_notes")
+            scores["short_notes"] = (notes if isinstance(notes, str) else "Baseline evaluation.")[:200]
+            results[index] = scores
+    return results
+
+
+def _batch_max_tokens(count: int) -> int:
+    return 60 + 160 * count
+
+
+def _batch_chunks(items: List[Dict[str, Any]]) -> List[Tuple[int, List[Dict[str, Any]]]]:
+    size = max(1, settings.OPENROUTER_EVAL_BATCH_SIZE)
+    return [(start, items[start:start + size]) for start in range(0, len(items), size)]
+
+
+def _log_batch_misses(chunks: List[Tuple[int, List[Dict[str, Any]]]], missing: int) -> None:
+    # Single-item chunks are never batched, so they do not count as misses
+    batched = sum(len(chunk) for _, chunk in chunks if len(chunk) > 1)
+    missed = missing - (sum(len(chunk) for _, chunk in chunks) - batched)
+    if missed:
+        print(f"⚠️ Batch evaluation missed {missed}/{batched} items. Evaluating individually.")
+
+
+def evaluate_answers_batch(
+    items: List[Dict[str, Any]],
+    profile: Dict[str, Any],
+) -> List[Dict[str, Any]]:
+    """
+    Evaluate several answers with one LLM call per OPENROUTER_EVAL_BATCH_SIZE items.
+
+    Each item holds the :func:`evaluate_answer` arguments (``question_text``,
+    ``transcript``, ``expected_keywords``, ``ideal_answer``). Results come back
+    in input order; items the batch response did not cover validly are
+    re-evaluated individually.
+    """
+    results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+    chunks = _batch_chunks(items)
+    for start, chunk in chunks:
+        if len(chunk) > 1:
+            messages = _build_batch_evaluation_messages(chunk, profile)
+            text = call_openrouter(messages, temperature=0.0, max_tokens=_batch_max_tokens(len(chunk)))
+            results[start:start + len(chunk)] = _parse_batch_evaluation(text, len(chunk))
+
+    missing = [i for i, r in enumerate(results) if r is None]
+    _log_batch_misses(chunks, len(missing))
+    for i in missing:
+        item = items[i]
+        results[i] = evaluate_answer(
+            item.get("question_text", ""),
+            item.get("transcript", ""),
+            item.get("expected_keywords") or [],
+            profile,
+            item.get("ideal_answer"),
+        )
+    return results
+
+
+async def evaluate_answers_batch_async(
+    items: List[Dict[str, Any]],
+    profile: Dict[str, Any],
+) -> List[Dict[str, Any]]:
+    """Async variant of :func:`evaluate_answers_batch`; batches and fallbacks run concurrently."""
+
+    async def run_batch(chunk: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        if len(chunk) == 1:
+            return [None]
+        messages = _build_batch_evaluation_messages(chunk, profile)
+        text = await call_openrouter_async(
+            messages, temperature=0.0, max_tokens=_batch_max_tokens(len(chunk))
+        )
+        return _parse_batch_evaluation(text, len(chunk))
+
+    chunks = _batch_chunks(items)
+    results: List[Optional[Dict[str, Any]]] = []
+    for parsed in await asyncio.gather(*(run_batch(chunk) for _, chunk in chunks)):
+        results.extend(parsed)
+
+    missing = [i for i, r in enumerate(results) if r is None]
+    _log_batch_misses(chunks, len(missing))
+    fallbacks = await asyncio.gather(*(
+        evaluate_answer_async(
+            items[i].get("question_text", ""),
+            items[i].get("transcript", ""),
+            items[i].get("expected_keywords") or [],
+            profile,
+            items[i].get("ideal_answer"),
+        )
+        for i in missing
+    ))
+    for i, evaluation in zip(missing, fallbacks):
+        results[i] = evaluation
+    return results
+
+
+# --------------------------------------------------------------------
+# Improved Answer
+# --------------------------------------------------------------------
+def _build_improve_messages(question_text: str, transcript: str) -> List[Dict[str, str]]:
     system_prompt = "Return ONLY a short improved answer (40–70 words). No JSON."
 
     user_prompt = f"""QUESTION: {question_text}
-ORIGINAL_ANSWER: {transcript}
+ORIGINAL_ANSWER: {compact_text(transcript, settings.OPENROUTER_TRANSCRIPT_TOKENS)}
 
 Provide a concise, professional improved version."""
 
-    messages = [
+    return [
         {"role": "system", "content": system_prompt},
         {"role": "user",  "content": user_prompt},
     ]
 
-    text = call_openrouter(messages, temperature=0.3, max_tokens=160)
 
+def _parse_improved(text: str, transcript: str) -> str:
     if text:
         cleaned = text.strip()
         if cleaned.startswith('"') and cleaned.endswith('"'):
@@ -498,43 +1396,133 @@ Provide a concise, professional improved version."""
     return transcript
 
 
+def finalize_improved_answer(text: str, transcript: str) -> str:
+    """Clean up a (possibly streamed) improved answer, falling back to the transcript."""
+    return _parse_improved(text, transcript)
+
+
+def improve_answer(
+    question_text: str,
+    transcript: str,
+    profile: Dict[str, Any],
+) -> str:
+    """
+    Return a concise improved answer (40–70 words). No JSON.
+    """
+    messages = _build_improve_messages(question_text, transcript)
+    text = call_openrouter(messages, temperature=0.3, max_tokens=160)
+    return _parse_improved(text, transcript)
+
+
+async def improve_answer_async(
+    question_text: str,
+    transcript: str,
+    profile: Dict[str, Any],
+) -> str:
+    """Async variant of :func:`improve_answer`."""
+    messages = _build_improve_messages(question_text, transcript)
+    text = await call_openrouter_async(messages, temperature=0.3, max_tokens=160)
+    return _parse_improved(text, transcript)
+
+
+async def stream_improved_answer_async(
+    question_text: str,
+    transcript: str,
+    profile: Dict[str, Any],
+) -> AsyncIterator[str]:
+    """Stream the improved answer; yields the original transcript if nothing arrives."""
+    messages = _build_improve_messages(question_text, transcript)
+    received = False
+    async for chunk in stream_openrouter_async(messages, temperature=0.3, max_tokens=160):
+        received = True
+        yield chunk
+    if not received:
+        yield transcript
+
+
 # --------------------------------------------------------------------
-# Final Report
+# Concurrent Evaluate + Improve
 # --------------------------------------------------------------------
-def generate_final_report(session_data: Dict[str, Any]) -> Dict[str, Any]:
+async def _with_deadline(coro: Awaitable[T], timeout: float, fallback: T, label: str) -> T:
+    """Await ``coro`` for at most ``timeout`` seconds, returning ``fallback`` otherwise."""
+    try:
+        return await asyncio.wait_for(coro, timeout)
+    except asyncio.TimeoutError:
+        print(f"⏱️ {label} exceeded {timeout:g}s deadline. Using fallback.")
+        return fallback
+
+
+async def evaluate_answer_with_deadline_async(
+    question_text: str,
+    transcript: str,
+    expected_keywords: List[str],
+    profile: Dict[str, Any],
+    ideal_answer: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Evaluate within OPENROUTER_EVALUATE_TIMEOUT, else return the baseline evaluation."""
+    return await _with_deadline(
+        evaluate_answer_async(
+            question_text, transcript, expected_keywords, profile, ideal_answer
+        ),
+        settings.OPENROUTER_EVALUATE_TIMEOUT,
+        _parse_evaluation(""),
+        "Evaluation",
+    )
+
+
+async def improve_answer_with_deadline_async(
+    question_text: str,
+    transcript: str,
+    profile: Dict[str, Any],
+) -> str:
+    """Improve within OPENROUTER_IMPROVE_TIMEOUT, else return the original transcript."""
+    return await _with_deadline(
+        improve_answer_async(question_text, transcript, profile),
+        settings.OPENROUTER_IMPROVE_TIMEOUT,
+        transcript,
+        "Improved answer",
+    )
+
+
+async def evaluate_and_improve_async(
+    question_text: str,
+    transcript: str,
+    expected_keywords: List[str],
+    profile: Dict[str, Any],
+    ideal_answer: Optional[str] = None,
+) -> Tuple[Dict[str, Any], str]:
     """
-    Summarize all evaluations and produce a final structured report.
+    Run evaluation and answer improvement concurrently.
 
-    Returns:
-        {
-            overall_summary: str,
-            technical_strengths: List[str],
-            technical_gaps: List[str],
-            communication_score: int,
-            behavioral_score: int,
-            improved_answers: List[Dict],
-            recommendations: List[str]
-        }
+    The two prompts are independent, so latency is the slower of the two
+    calls rather than their sum. Each call has its own deadline and falls
+    back to the baseline evaluation / original transcript on timeout.
     """
+    evaluation, improved = await asyncio.gather(
+        evaluate_answer_with_deadline_async(
+            question_text, transcript, expected_keywords, profile, ideal_answer
+        ),
+        improve_answer_with_deadline_async(question_text, transcript, profile),
+    )
+    return evaluation, improved
+
+
+# --------------------------------------------------------------------
+# Final Report
+# --------------------------------------------------------------------
+def _report_averages(evaluations: List[Dict[str, Any]]) -> Dict[str, float]:
+    n = len(evaluations)
+    return {
+        key: sum(e.get(key, 0) for e in evaluations) / n
+        for key in ("technical", "communication", "confidence", "relevance")
+    }
+
+
+def _session_summary(session_data: Dict[str, Any]) -> List[Dict[str, Any]]:
     questions = session_data.get("questions", [])
     evaluations = session_data.get("evaluations", [])
     answers = session_data.get("answers", [])
-
-    if not evaluations:
-        return {
-            "overall_summary": "No evaluations available.",
-            "technical_strengths": [],
-            "technical_gaps": [],
-            "communication_score": 0,
-            "behavioral_score": 0,
-            "improved_answers": [],
-            "recommendations": [],
-        }
-
-    avg_technical = sum(e.get("technical", 0) for e in evaluations) / len(evaluations)
-    avg_communication = sum(e.get("communication", 0) for e in evaluations) / len(evaluations)
-    avg_confidence = sum(e.get("confidence", 0) for e in evaluations) / len(evaluations)
-    avg_relevance = sum(e.get("relevance", 0) for e in evaluations) / len(evaluations)
+    budget = settings.OPENROUTER_REPORT_ANSWER_TOKENS
 
     session_summary = []
     for q, e, a in zip(
@@ -545,8 +1533,8 @@ def generate_final_report(session_data: Dict[str, Any]) -> Dict[str, Any]:
         session_summary.append(
             {
                 "question": q.get("text", ""),
-                "ideal_answer": q.get("ideal_answer", ""),
-                "candidate_answer": a.get("transcript", ""),
+                "ideal_answer": compact_text(q.get("ideal_answer", ""), budget),
+                "candidate_answer": compact_text(a.get("transcript", ""), budget),
                 "technical": e.get("technical", 0),
                 "communication": e.get("communication", 0),
                 "confidence": e.get("confidence", 0),
@@ -554,6 +1542,14 @@ def generate_final_report(session_data: Dict[str, Any]) -> Dict[str, Any]:
                 "notes": e.get("short_notes", ""),
             }
         )
+    return session_summary
+
+
+def _build_report_messages(
+    session_data: Dict[str, Any],
+    averages: Dict[str, float],
+) -> List[Dict[str, str]]:
+    session_summary = _session_summary(session_data)
 
     system_prompt = """You are a report generator. Output ONLY JSON:
 {
@@ -572,19 +1568,23 @@ Generate concise insights."""
 {json.dumps(session_summary, indent=2)}
 
 Average Scores:
-- Technical: {avg_technical:.1f}
-- Communication: {avg_communication:.1f}
-- Confidence: {avg_confidence:.1f}
-- Relevance: {avg_relevance:.1f}
+- Technical: {averages["technical"]:.1f}
+- Communication: {averages["communication"]:.1f}
+- Confidence: {averages["confidence"]:.1f}
+- Relevance: {averages["relevance"]:.1f}
 
 Generate a comprehensive report."""
 
-    messages = [
+    return [
         {"role": "system", "content": system_prompt},
         {"role": "user",  "content": user_prompt},
     ]
 
-    text = call_openrouter(messages, temperature=0.2, max_tokens=400)
+
+def _parse_report(text: str, averages: Dict[str, float]) -> Dict[str, Any]:
+    avg_technical = averages["technical"]
+    avg_communication = averages["communication"]
+    avg_confidence = averages["confidence"]
 
     if text:
         parsed = _parse_json_from_text(text)
@@ -615,4 +1615,90 @@ Generate a comprehensive report."""
         "behavioral_score": int(avg_confidence),
         "improved_answers": [],
         "recommendations": ["Practice more interview questions", "Focus on clear communication"],
-    }
\ No newline at end of file
+    }
+
+
+_EMPTY_REPORT: Dict[str, Any] = {
+    "overall_summary": "No evaluations available.",
+    "technical_strengths": [],
+    "technical_gaps": [],
+    "communication_score": 0,
+    "behavioral_score": 0,
+    "improved_answers": [],
+    "recommendations": [],
+}
+
+
+def generate_final_report(session_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Summarize all evaluations and produce a final structured report.
+
+    Returns:
+        {
+            overall_summary: str,
+            technical_strengths: List[str],
+            technical_gaps: List[str],
+            communication_score: int,
+            behavioral_score: int,
+            improved_answers: List[Dict],
+            recommendations: List[str]
+        }
+    """
+    evaluations = session_data.get("evaluations", [])
+    if not evaluations:
+        return dict(_EMPTY_REPORT)
+
+    averages = _report_averages(evaluations)
+    messages = _build_report_messages(session_data, averages)
+    text = call_openrouter(messages, temperature=0.2, max_tokens=400)
+    return _parse_report(text, averages)
+
+
+async def generate_final_report_async(session_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Async variant of :func:`generate_final_report`."""
+    evaluations = session_data.get("evaluations", [])
+    if not evaluations:
+        return dict(_EMPTY_REPORT)
+
+    averages = _report_averages(evaluations)
+    messages = _build_report_messages(session_data, averages)
+    text = await call_openrouter_async(messages, temperature=0.2, max_tokens=400)
+    return _parse_report(text, averages)
+
+
+async def stream_report_summary_async(session_data: Dict[str, Any]) -> AsyncIterator[str]:
+    """
+    Stream a plain-text overall summary for the session.
+
+    Uses a prose prompt (not the JSON report prompt) so tokens can be shown
+    as they arrive. Falls back to the averages-based summary.
+    """
+    evaluations = session_data.get("evaluations", [])
+    if not evaluations:
+        yield _EMPTY_REPORT["overall_summary"]
+        return
+
+    averages = _report_averages(evaluations)
+    system_prompt = (
+        "You are an interview coach. Write a concise overall summary (3-5 sentences) "
+        "of the candidate's performance. Plain text only, no JSON or markdown."
+    )
+    user_prompt = f"""SESSION DATA:
+{json.dumps(_session_summary(session_data), indent=2)}
+
+Average Scores:
+- Technical: {averages["technical"]:.1f}
+- Communication: {averages["communication"]:.1f}
+- Confidence: {averages["confidence"]:.1f}
+- Relevance: {averages["relevance"]:.1f}"""
+    messages = [
+        {"role": "system", "content": system_prompt},
+        {"role": "user",  "content": user_prompt},
+    ]
+
+    received = False
+    async for chunk in stream_openrouter_async(messages, temperature=0.2, max_tokens=300):
+        received = True
+        yield chunk
+    if not received:
+        yield _parse_report("", averages)["overall_summary"]
@@ -3,6 +3,7 @@ from typing import Dict, Any, List
 import re
 # import torch  # Deprecated - no longer using HuggingFace
 from app.services.llm import llm_service
+from app.utils.text_vectors import relevance, vectorize_cached
 
 class ScoringEngine:
     def __init__(self):
@@ -36,12 +37,9 @@ class ScoringEngine:
     def _basic_technical_analysis(self, question: str, answer: str) -> Dict[str, Any]:
         """Basic technical analysis as fallback"""
         answer_length = len(answer.strip())
-        question_words = set(question.lower().split())
-        answer_words = set(answer.lower().split())
 
-        # Simple relevance check
-        common_words = question_words.intersection(answer_words)
-        relevance_score = min(100, len(common_words) * 20)
+        # Relevance from hashed n-gram vectors (question vector is memoised)
+        relevance_score = relevance(vectorize_cached(question), answer) * 100
 
         # Length-based completeness
         completeness_score = min(100, answer_length / 2)
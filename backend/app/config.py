@@ -36,6 +36,87 @@ class Settings(BaseSettings):
     OPENROUTER_API_KEY: Optional[str] = None
     OPENROUTER_MODEL: str = "amazon/nova-2-lite-v1:free"
     OPENROUTER_BASE: str = "https://api.openrouter.ai/v1/chat/completions"
+
+    # OpenRouter HTTP transport (pooled, keep-alive client per worker)
+    OPENROUTER_POOL_SIZE: int = 20
+    OPENROUTER_KEEPALIVE_CONNECTIONS: int = 10
+    OPENROUTER_KEEPALIVE_EXPIRY: float = 30.0
+    OPENROUTER_HTTP2: bool = True
+
+    # In-memory LLM response cache (per worker)
+    OPENROUTER_CACHE_MAX_ENTRIES: int = 2048
+    OPENROUTER_CACHE_MAX_BYTES: int = 16 * 1024 * 1024
+    OPENROUTER_CACHE_TTL: float = 3600.0
+
+    # Optional persistent cache for deterministic (temperature=0) prompts,
+    # shared by all workers on the host. Disabled when the path is unset.
+    OPENROUTER_DISK_CACHE_PATH: Optional[str] = None
+    OPENROUTER_DISK_CACHE_MAX_ENTRIES: int = 50000
+    OPENROUTER_DISK_CACHE_MAX_BYTES: int = 256 * 1024 * 1024
+    OPENROUTER_DISK_CACHE_TTL: float = 7 * 24 * 3600.0
+
+    # Client-side rate limiting of upstream calls (per worker).
+    # Requests over the limit queue for up to OPENROUTER_QUEUE_TIMEOUT seconds.
+    OPENROUTER_RATE_LIMIT_PER_SEC: float = 3.0
+    OPENROUTER_RATE_LIMIT_BURST: int = 6
+    OPENROUTER_MAX_CONCURRENCY: int = 8
+    OPENROUTER_QUEUE_TIMEOUT: float = 15.0
+
+    # Retries for transient upstream failures (429/5xx/network)
+    OPENROUTER_MAX_ATTEMPTS: int = 3
+    OPENROUTER_RETRY_BASE_DELAY: float = 0.5
+    OPENROUTER_RETRY_MAX_DELAY: float = 8.0
+
+    # Circuit breaker: skip OpenRouter and use local fallbacks while it is failing
+    OPENROUTER_BREAKER_WINDOW: int = 20
+    OPENROUTER_BREAKER_MIN_CALLS: int = 5
+    OPENROUTER_BREAKER_FAILURE_RATE: float = 0.5
+    OPENROUTER_BREAKER_SLOW_CALL_SECONDS: float = 20.0
+    OPENROUTER_BREAKER_RESET_SECONDS: float = 30.0
+    OPENROUTER_BREAKER_HALF_OPEN_CALLS: int = 1
+
+    # Hedged evaluation requests (opt-in). A duplicate is sent once the primary
+    # exceeds the recent latency percentile (OPENROUTER_HEDGE_DELAY until enough
+    # samples exist), limited to OPENROUTER_HEDGE_BUDGET extra calls per request.
+    OPENROUTER_HEDGE_EVALUATION: bool = False
+    OPENROUTER_HEDGE_PERCENTILE: float = 95.0
+    OPENROUTER_HEDGE_DELAY: float = 4.0
+    OPENROUTER_HEDGE_BUDGET: float = 0.1
+    OPENROUTER_HEDGE_MODEL: Optional[str] = None
+
+    # Per-task deadlines (seconds) for /interview/answer fan-out
+    OPENROUTER_EVALUATE_TIMEOUT: float = 30.0
+    OPENROUTER_IMPROVE_TIMEOUT: float = 30.0
+
+    # Prompt input budgets (estimated tokens); longer text is compacted/truncated
+    OPENROUTER_TRANSCRIPT_TOKENS: int = 700
+    OPENROUTER_IDEAL_ANSWER_TOKENS: int = 250
+    OPENROUTER_REPORT_ANSWER_TOKENS: int = 150
+
+    # Max answers packed into one evaluate_answers_batch call
+    OPENROUTER_EVAL_BATCH_SIZE: int = 8
+
+    # Stream question generation so /interview/start returns after the first question
+    OPENROUTER_STREAM_QUESTIONS: bool = True
+
+    # Interview session storage: "memory" (per worker) or "database" (shared by
+    # all workers through DATABASE_URL). In-memory sessions expire after
+    # SESSION_TTL_SECONDS idle and the least recently used are evicted above
+    # SESSION_MAX_SESSIONS.
+    SESSION_STORE: str = "memory"
+    SESSION_TTL_SECONDS: float = 6 * 3600.0
+    SESSION_MAX_SESSIONS: int = 1000
+
+    # Database sessions: queue writes and flush them in batches from a background
+    # task, every SESSION_FLUSH_INTERVAL seconds or once SESSION_FLUSH_BATCH_SIZE
+    # writes are waiting. Also flushed before reports and on shutdown. Sessions
+    # are then served from the worker's cache, so only enable this with a single
+    # worker or sticky sessions. A write failing SESSION_FLUSH_MAX_ATTEMPTS
+    # flushes in a row is dropped to the store's dead letters.
+    SESSION_WRITE_BEHIND: bool = False
+    SESSION_FLUSH_INTERVAL: float = 1.0
+    SESSION_FLUSH_BATCH_SIZE: int = 50
+    SESSION_FLUSH_MAX_ATTEMPTS: int = 5
     
     # Legacy - kept for backward compatibility
     HUGGINGFACE_API_KEY: Optional[str] = None
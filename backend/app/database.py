@@ -1,5 +1,5 @@
 # backend/app/database.py
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.config import get_settings
@@ -19,4 +19,29 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+# Columns added to existing tables after their first release. create_all only
+# creates missing tables, so these are added to older databases with ALTER TABLE.
+ADDED_COLUMNS = {
+    "interviews": {"session_state": "JSON", "score_totals": "JSON"},
+    "responses": {"dedupe_key": "VARCHAR"},
+}
+
+def ensure_schema(bind=None):
+    """Create missing tables and add the columns (and their indexes) older databases lack"""
+    import app.models  # noqa: F401  (register every model so foreign keys resolve)
+
+    bind = bind or engine
+    Base.metadata.create_all(bind=bind)
+    inspector = inspect(bind)
+    for table, columns in ADDED_COLUMNS.items():
+        existing = {column["name"] for column in inspector.get_columns(table)}
+        for name, column_type in columns.items():
+            if name in existing:
+                continue
+            with bind.begin() as conn:
+                conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {name} {column_type}"))
+            print(f"✅ Added {table}.{name} column")
+        for index in Base.metadata.tables[table].indexes:
+            index.create(bind=bind, checkfirst=True)
@@ -2,11 +2,14 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
+import asyncio
 import os
 
 from app.routes import health_check, interview_routes, resume_routes, report_routes, auth_routes
 from app.middleware.cors import setup_cors
 from app.config import get_settings
+from app.database import ensure_schema
+from app.ai_engines.openrouter_engine import aclose_http_clients
 
 # Initialize settings
 settings = get_settings()
@@ -34,6 +37,31 @@ app.include_router(report_routes.router, prefix="/api/v1/reports", tags=["Report
 app.include_router(auth_routes.router, tags=["Auth"])
 
 
+@app.on_event("startup")
+async def upgrade_schema():
+  # Columns added since older databases were created (e.g. interviews.session_state);
+  # every route querying those models needs them, whichever session store is used
+  await asyncio.to_thread(ensure_schema)
+
+
+@app.on_event("startup")
+async def start_session_store():
+  # Background flushing of write-behind session writes
+  await interview_routes.SESSION_STORE.start()
+
+
+@app.on_event("shutdown")
+async def shutdown_session_store():
+  # Final synchronous flush of queued session writes
+  await interview_routes.SESSION_STORE.aclose()
+
+
+@app.on_event("shutdown")
+async def shutdown_http_clients():
+  # Release pooled OpenRouter connections held by this worker
+  await aclose_http_clients()
+
+
 @app.get("/")
 async def root():
   return {
@@ -20,6 +20,8 @@ class Interview(Base):
     current_question_index = Column(Integer, default=0)
     questions = Column(JSON, default=list)  # List of questions asked
     answers = Column(JSON, default=list)    # List of answers given
+    session_state = Column(JSON, nullable=True)  # Profile, persona and metrics of /api/interview sessions
+    score_totals = Column(JSON, nullable=True)   # Count and sum/min/max per score of its responses
     
     # Timestamps
     started_at = Column(DateTime(timezone=True), server_default=func.now())
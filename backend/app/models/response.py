@@ -1,9 +1,15 @@
 # backend/app/models/response.py
-from sqlalchemy import Column, Integer, String, DateTime, JSON, Float, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, DateTime, JSON, Float, ForeignKey, Index, Text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.database import Base
 
+
+def overall_score(technical: float, communication: float, confidence: float) -> float:
+    """Weighted overall score of an answer, as stored in ``Response.overall_score``"""
+    return technical * 0.4 + communication * 0.35 + confidence * 0.25
+
+
 class Response(Base):
     __tablename__ = "responses"
 
@@ -25,9 +31,16 @@ class Response(Base):
     
     # Detailed analysis
     analysis_data = Column(JSON, default=dict)
+    # Idempotency key or question/transcript hash of /api/interview answers;
+    # unique per interview, so a retry on another worker cannot insert twice
+    dedupe_key = Column(String, nullable=True)
     
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationships
-    interview = relationship("Interview", backref="responses")
\ No newline at end of file
+    interview = relationship("Interview", backref="responses")
+
+    __table_args__ = (
+        Index("ix_responses_interview_dedupe_key", "interview_id", "dedupe_key", unique=True),
+    )
\ No newline at end of file
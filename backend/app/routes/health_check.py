@@ -1,6 +1,8 @@
 # backend/app/routes/health_check.py
 from fastapi import APIRouter
 
+from app.ai_engines.openrouter_engine import get_llm_metrics
+
 router = APIRouter()
 
 @router.get("/health")
@@ -12,4 +14,8 @@ async def health_check():
 
 @router.get("/ping")
 async def ping():
-    return {"message": "pong"}
\ No newline at end of file
+    return {"message": "pong"}
+
+@router.get("/health/llm")
+async def llm_metrics():
+    return get_llm_metrics()
@@ -1,19 +1,38 @@
 # backend/app/routes/interview_routes.py
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from datetime import datetime
+import asyncio
+import json
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 import uuid
 
+from app.config import get_settings
 from app.ai_engines.openrouter_engine import (
-    generate_questions_from_profile,
-    evaluate_answer,
-    improve_answer,
-    generate_final_report
+    generate_questions_from_profile_async,
+    generate_questions_streaming_async,
+    evaluate_and_improve_async,
+    evaluate_answer_with_deadline_async,
+    improve_answer_with_deadline_async,
+    generate_final_report_async,
+    stream_improved_answer_async,
+    stream_report_summary_async,
+    finalize_improved_answer,
+    is_fallback_evaluation,
 )
+from app.services.session_store import (
+    DuplicateAnswerError,
+    create_session_store,
+    find_question,
+    score_averages,
+)
+from app.utils.concurrency import KeyedAsyncLock
+from app.utils.text_vectors import SparseVector, reference_vector, relevance
 
 router = APIRouter()
+settings = get_settings()
 
 
 class StartReq(BaseModel):
@@ -33,12 +52,26 @@ class AnswerReq(BaseModel):
   question_id: str
   transcript: str
   metrics: Dict[str, Any]
+  # Return immediately and generate the improved answer in the background
+  defer_improved: Optional[bool] = False
+  # Retries with the same key get the first result back instead of a re-evaluation
+  # (the Idempotency-Key header works too). Without a key, resending the same
+  # transcript for an answered question is replayed the same way.
+  idempotency_key: Optional[str] = None
 
 
 class AnswerRes(BaseModel):
   evaluation: Dict[str, Any]
   improved: str
   next_question: Optional[Dict[str, Any]] = None
+  improved_pending: bool = False
+
+
+class ImprovedRes(BaseModel):
+  session_id: str
+  question_id: str
+  status: str
+  improved: Optional[str] = None
 
 
 class MetricsReq(BaseModel):
@@ -74,11 +107,143 @@ class ReportListRes(BaseModel):
   reports: List[ReportListItem]
 
 
-SESSIONS: Dict[str, Dict[str, Any]] = {}
+# Sessions live behind a SessionStore (in-memory per worker, or the database
+# when SESSION_STORE=database); routes change them only through its methods.
+SESSION_STORE = create_session_store()
+
+# session_id -> lock serialising answer submissions to that session (per worker)
+SESSION_LOCKS = KeyedAsyncLock()
+
+# session_id -> question_id -> in-flight improved-answer task
+PENDING_IMPROVEMENTS: Dict[str, Dict[str, "asyncio.Task[None]"]] = {}
+
+# session_id -> task still streaming the rest of the session's questions
+PENDING_QUESTIONS: Dict[str, "asyncio.Task[None]"] = {}
+
+
+async def _add_question(session_id: str, session: Dict[str, Any], question: Dict[str, Any]) -> None:
+  """Append a question and cache its reference vector for local relevance scoring."""
+  session["question_vectors"][str(question.get("id"))] = _question_vector(question).to_dict()
+  await SESSION_STORE.aadd_question(session_id, session, question)
+
+
+def _question_vector(question: Dict[str, Any]) -> SparseVector:
+  return reference_vector(
+    question.get("ideal_answer", ""),
+    question.get("expected_keywords", []),
+    question.get("text") or question.get("question") or "",
+  )
+
+
+def _local_relevance(session: Dict[str, Any], question: Dict[str, Any], transcript: str) -> int:
+  """0-100 relevance of the transcript to the question's cached reference vector."""
+  vectors = session.setdefault("question_vectors", {})
+  cached = vectors.get(str(question.get("id")))
+  if cached is None:
+    reference = _question_vector(question)
+    vectors[str(question.get("id"))] = reference.to_dict()
+  else:
+    reference = SparseVector.from_dict(cached)
+  return round(relevance(reference, transcript) * 100)
+
+
+async def _stream_questions(session_id: str, session: Dict[str, Any]) -> Dict[str, Any]:
+  """
+  Start streaming the session's questions into ``session["questions"]``.
+
+  Returns as soon as the first question is parsed; the remaining ones keep
+  arriving in a background task tracked in PENDING_QUESTIONS. The whole
+  stream is consumed inside that one task.
+  """
+  first_ready: "asyncio.Future[Dict[str, Any]]" = asyncio.get_running_loop().create_future()
+
+  async def run() -> None:
+    try:
+      async for question in generate_questions_streaming_async(
+        profile=session["profile"],
+        persona=session["persona"],
+        interview_type=session["interview_type"],
+      ):
+        await _add_question(session_id, session, question)
+        if not first_ready.done():
+          first_ready.set_result(question)
+    except Exception as e:
+      print(f"Error streaming questions: {e}")
+      if not session["questions"]:
+        for question in await generate_questions_from_profile_async(
+          profile=session["profile"],
+          persona=session["persona"],
+          interview_type=session["interview_type"],
+        ):
+          await _add_question(session_id, session, question)
+      if not first_ready.done() and session["questions"]:
+        first_ready.set_result(session["questions"][0])
+    finally:
+      PENDING_QUESTIONS.pop(session_id, None)
+      if not first_ready.done():
+        first_ready.set_exception(RuntimeError("No questions generated"))
+
+  PENDING_QUESTIONS[session_id] = asyncio.create_task(run())
+  # Shielded so a client disconnect does not abort generation for the session
+  return await asyncio.shield(first_ready)
+
+
+async def _await_pending_questions(session_id: str) -> None:
+  task = PENDING_QUESTIONS.get(session_id)
+  if task is not None:
+    await asyncio.gather(task, return_exceptions=True)
+
+
+def _schedule_improvement(
+  session_id: str,
+  session: Dict[str, Any],
+  answer_index: int,
+  question_text: str,
+  profile: Dict[str, Any],
+) -> None:
+  """Generate the improved answer off the request path and store it on the answer record."""
+  answer_record = session["answers"][answer_index]
+  question_id = answer_record["question_id"]
+
+  async def run() -> None:
+    try:
+      answer_record["improved"] = await improve_answer_with_deadline_async(
+        question_text, answer_record["transcript"], profile
+      )
+      answer_record["improved_status"] = "ready"
+      await SESSION_STORE.aupdate_answer(session_id, session, answer_index)
+    except asyncio.CancelledError:
+      # A streaming client took over generation of this answer
+      pass
+    finally:
+      pending = PENDING_IMPROVEMENTS.get(session_id, {})
+      pending.pop(question_id, None)
+      if not pending:
+        PENDING_IMPROVEMENTS.pop(session_id, None)
+
+  PENDING_IMPROVEMENTS.setdefault(session_id, {})[question_id] = asyncio.create_task(run())
+
+
+def _sse(event: str, data: Dict[str, Any]) -> str:
+  return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def _sse_response(events: AsyncIterator[str]) -> StreamingResponse:
+  return StreamingResponse(
+    events,
+    media_type="text/event-stream",
+    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+  )
+
+
+async def _await_pending_improvements(session_id: str) -> None:
+  pending = PENDING_IMPROVEMENTS.get(session_id)
+  if pending:
+    await asyncio.gather(*list(pending.values()), return_exceptions=True)
 
 
 @router.post("/interview/start", response_model=StartRes)
-def start(req: StartReq) -> StartRes:
+async def start(req: StartReq) -> StartRes:
   session_id = str(uuid.uuid4())
 
   # Use role from request or profile
@@ -92,101 +257,308 @@ def start(req: StartReq) -> StartRes:
   profile["interview_type"] = interview_type
   profile["persona"] = persona
 
-  # Generate questions using OpenRouter engine
-  questions = generate_questions_from_profile(
-      profile=profile,
-      persona=persona,
-      interview_type=interview_type
-  )
-
-  SESSIONS[session_id] = {
+  session: Dict[str, Any] = {
     "profile": profile,
     "interview_type": interview_type,
     "persona": persona,
-    "questions": questions,
+    "questions": [],
+    # question_id -> (position, question), kept by SESSION_STORE.add_question
+    "question_index": {},
+    # question_id -> reference vector of ideal answer + keywords (see _add_question)
+    "question_vectors": {},
     "answers": [],
     "evaluations": [],
+    # Running count and sum/min/max per score, kept by SESSION_STORE.add_answer
+    "score_totals": None,
     "current_question_index": 0,
     "created_at": datetime.utcnow().isoformat(),
     "role": role,
     "started_at": datetime.utcnow().isoformat(),
   }
+  await SESSION_STORE.acreate(session_id, session)
+
+  # Generate questions using OpenRouter engine
+  if settings.OPENROUTER_STREAM_QUESTIONS:
+    first = await _stream_questions(session_id, session)
+  else:
+    for question in await generate_questions_from_profile_async(
+        profile=profile,
+        persona=persona,
+        interview_type=interview_type
+    ):
+      await _add_question(session_id, session, question)
+    first = session["questions"][0]
 
-  first = questions[0]
   return StartRes(session_id=session_id, question=first)
 
 
 @router.post("/interview/answer", response_model=AnswerRes)
-def answer(req: AnswerReq) -> AnswerRes:
-  session = SESSIONS.get(req.session_id)
-  if not session:
-    raise HTTPException(status_code=404, detail="Session not found")
+async def answer(
+  req: AnswerReq,
+  idempotency_key_header: Optional[str] = Header(None, alias="Idempotency-Key"),
+) -> AnswerRes:
+  """
+  Evaluate and record an answer.
+
+  A repeat of an answer already recorded (same idempotency key, or without one
+  the same question and transcript) returns the first result. Within a worker
+  the session lock serialises the check; across workers sharing the database
+  store, the unique ``responses.dedupe_key`` index rejects the second insert
+  and the answer recorded first is replayed.
+  """
+  idempotency_key = req.idempotency_key or idempotency_key_header
+
+  # Later questions may still be streaming in
+  await _await_pending_questions(req.session_id)
+
+  # Answers to one session are recorded one at a time, so a double-submit
+  # waits for the first and is then replayed instead of appended twice.
+  # Other sessions are not blocked.
+  async with SESSION_LOCKS.hold(req.session_id):
+    session = await SESSION_STORE.aget(req.session_id)
+    if not session:
+      raise HTTPException(status_code=404, detail="Session not found")
+
+    record = _recorded_answer(session, req, idempotency_key)
+    if record is not None:
+      return _replay_answer(session, record)
+
+    try:
+      return await _submit_answer(req, session, idempotency_key)
+    except DuplicateAnswerError:
+      # Another worker stored the same answer while this one evaluated it
+      session = await SESSION_STORE.aget(req.session_id)
+      record = _recorded_answer(session, req, idempotency_key) if session else None
+      if record is None:
+        raise HTTPException(status_code=409, detail="Answer already recorded")
+      return _replay_answer(session, record)
+
+
+def _recorded_answer(
+  session: Dict[str, Any],
+  req: AnswerReq,
+  idempotency_key: Optional[str],
+) -> Optional[Dict[str, Any]]:
+  """
+  The answer a submission repeats, if any.
+
+  With a key, the record carrying that key. Without one (the web client sends
+  none), a record for the same question with the same transcript: resending
+  an identical answer is a retry, not a new attempt.
+  """
+  for record in reversed(session["answers"]):
+    if idempotency_key:
+      if record.get("idempotency_key") == idempotency_key:
+        return record
+    elif record.get("question_id") == req.question_id and record.get("transcript") == req.transcript:
+      return record
+  return None
+
+
+def _lookup_question(session: Dict[str, Any], question_id: str) -> Tuple[int, Dict[str, Any]]:
+  """``(position, question)`` for an id of this session; 422/404 for a missing or unknown id."""
+  if not str(question_id or "").strip():
+    raise HTTPException(status_code=422, detail="question_id is required")
+  found = find_question(session, question_id)
+  if found is None:
+    raise HTTPException(status_code=404, detail=f"Question '{question_id}' not found in session")
+  return found
+
+
+def _next_question(session: Dict[str, Any], question_id: str) -> Optional[Dict[str, Any]]:
+  found = find_question(session, question_id)
+  if found is None:
+    return None
+  questions = session["questions"]
+  return questions[found[0] + 1] if found[0] + 1 < len(questions) else None
+
+
+def _replay_answer(session: Dict[str, Any], record: Dict[str, Any]) -> AnswerRes:
+  """The response already given for a recorded answer."""
+  pending = record.get("improved_status", "ready") != "ready"
+  return AnswerRes(
+    evaluation=record["evaluation"],
+    improved="" if pending else record.get("improved", ""),
+    next_question=_next_question(session, record["question_id"]),
+    improved_pending=pending,
+  )
 
+
+async def _submit_answer(
+  req: AnswerReq,
+  session: Dict[str, Any],
+  idempotency_key: Optional[str],
+) -> AnswerRes:
   # Find question object, text, and index
-  question_obj = None
-  question_text = ""
-  idx = 0
-  for i, q in enumerate(session["questions"]):
-    if str(q.get("id")) == str(req.question_id):
-      question_obj = q
-      question_text = q.get("text") or q.get("question") or ""
-      idx = i
-      break
-  
+  idx, question_obj = _lookup_question(session, req.question_id)
+  question_text = question_obj.get("text") or question_obj.get("question") or ""
+
   # Get ideal answer and expected keywords from question
   ideal_answer = question_obj.get("ideal_answer", "")
   expected_keywords = question_obj.get("expected_keywords", [])
 
-  # Evaluate answer using OpenRouter
-  eval_res = evaluate_answer(
-      question_text=question_text,
-      transcript=req.transcript,
-      expected_keywords=expected_keywords,
-      profile=session.get("profile") or {},
-      ideal_answer=ideal_answer
-  )
-  
-  # Generate improved answer
-  improved = improve_answer(
-      question_text,
-      req.transcript,
-      session.get("profile") or {}
-  )
+  profile = session.get("profile") or {}
+  if req.defer_improved:
+    # Only the evaluation is on the critical path; improvement runs in the background
+    eval_res = await evaluate_answer_with_deadline_async(
+        question_text=question_text,
+        transcript=req.transcript,
+        expected_keywords=expected_keywords,
+        profile=profile,
+        ideal_answer=ideal_answer
+    )
+    improved = ""
+  else:
+    # Evaluate answer and generate improved answer concurrently using OpenRouter
+    eval_res, improved = await evaluate_and_improve_async(
+        question_text=question_text,
+        transcript=req.transcript,
+        expected_keywords=expected_keywords,
+        profile=profile,
+        ideal_answer=ideal_answer
+    )
 
-  session["answers"].append(
-    {
-      "question_id": req.question_id,
-      "question": question_text,
-      "transcript": req.transcript,
-      "metrics": req.metrics,
-      "evaluation": eval_res,
-      "improved": improved,
-    }
-  )
-  session["evaluations"].append(eval_res)
+  # Cheap local relevance signal; stands in for the LLM's when evaluation fell back
+  eval_res["local_relevance"] = _local_relevance(session, question_obj, req.transcript)
+  if is_fallback_evaluation(eval_res):
+    eval_res["relevance"] = eval_res["local_relevance"]
+
+  answer_record = {
+    "question_id": req.question_id,
+    "question": question_text,
+    "transcript": req.transcript,
+    "metrics": req.metrics,
+    "evaluation": eval_res,
+    "improved": improved,
+    "improved_status": "pending" if req.defer_improved else "ready",
+  }
+  if idempotency_key:
+    answer_record["idempotency_key"] = idempotency_key
+  answer_index = await SESSION_STORE.aadd_answer(req.session_id, session, answer_record)
+
+  if req.defer_improved:
+    _schedule_improvement(req.session_id, session, answer_index, question_text, profile)
 
   # Determine next question if available
   next_q: Optional[Dict[str, Any]] = None
   if idx + 1 < len(session["questions"]):
     next_q = session["questions"][idx + 1]
 
-  return AnswerRes(evaluation=eval_res, improved=improved, next_question=next_q)
+  return AnswerRes(
+    evaluation=eval_res,
+    improved=improved,
+    next_question=next_q,
+    improved_pending=bool(req.defer_improved),
+  )
+
+
+@router.get("/interview/{session_id}/improved/{question_id}/stream")
+async def stream_improved(session_id: str, question_id: str) -> StreamingResponse:
+  """
+  Stream the improved answer for an answered question as Server-Sent Events.
+
+  Emits ``token`` events with text chunks and a final ``done`` event with the
+  full improved answer. If a deferred background improvement is still
+  pending it is cancelled and this stream produces the answer instead; if
+  the client disconnects first, the background task is started again.
+  """
+  session = await SESSION_STORE.aget(session_id)
+  if not session:
+    raise HTTPException(status_code=404, detail="Session not found")
+
+  record = None
+  answer_index = -1
+  for answer_index in range(len(session.get("answers", [])) - 1, -1, -1):
+    if str(session["answers"][answer_index].get("question_id")) == str(question_id):
+      record = session["answers"][answer_index]
+      break
+  if record is None:
+    raise HTTPException(status_code=404, detail="Answer not found")
+
+  async def events() -> AsyncIterator[str]:
+    if record.get("improved_status", "ready") == "ready":
+      yield _sse("token", {"text": record.get("improved", "")})
+      yield _sse("done", {"improved": record.get("improved", "")})
+      return
+
+    task = PENDING_IMPROVEMENTS.get(session_id, {}).get(str(question_id))
+    if task is not None:
+      task.cancel()
+
+    profile = session.get("profile") or {}
+    parts: List[str] = []
+    try:
+      async for chunk in stream_improved_answer_async(
+        record.get("question", ""), record["transcript"], profile
+      ):
+        parts.append(chunk)
+        yield _sse("token", {"text": chunk})
+
+      record["improved"] = finalize_improved_answer("".join(parts), record["transcript"])
+      record["improved_status"] = "ready"
+      await SESSION_STORE.aupdate_answer(session_id, session, answer_index)
+      yield _sse("done", {"improved": record["improved"]})
+    finally:
+      # Client went away (or the stream failed) before the answer was stored:
+      # hand generation back to a background task so polling and the report
+      # still get an improved answer.
+      if record.get("improved_status") != "ready":
+        _schedule_improvement(session_id, session, answer_index, record.get("question", ""), profile)
+
+  return _sse_response(events())
+
+
+@router.get("/interview/{session_id}/improved/{question_id}", response_model=ImprovedRes)
+def get_improved(session_id: str, question_id: str) -> ImprovedRes:
+  """Poll for an improved answer generated in the background."""
+  session = SESSION_STORE.get(session_id)
+  if not session:
+    raise HTTPException(status_code=404, detail="Session not found")
+
+  for record in reversed(session.get("answers", [])):
+    if str(record.get("question_id")) == str(question_id):
+      status = record.get("improved_status", "ready")
+      return ImprovedRes(
+        session_id=session_id,
+        question_id=question_id,
+        status=status,
+        improved=record.get("improved") if status == "ready" else None,
+      )
+
+  raise HTTPException(status_code=404, detail="Answer not found")
 
 
 @router.post("/metrics")
-def store_metrics(req: MetricsReq) -> Dict[str, str]:
+async def store_metrics(req: MetricsReq) -> Dict[str, str]:
   # Optional endpoint; we also store metrics in /answer.
-  session = SESSIONS.get(req.session_id) if req.session_id else None
+  session = await SESSION_STORE.aget(req.session_id) if req.session_id else None
   if session:
-    session.setdefault("extra_metrics", []).append(
-      {"question_id": req.question_id, "metrics": req.metrics}
+    await SESSION_STORE.aadd_metrics(
+      req.session_id, session, {"question_id": req.question_id, "metrics": req.metrics}
     )
   return {"status": "ok"}
 
 
+def _fallback_summary(session: Dict[str, Any]) -> str:
+  if not session.get("evaluations"):
+    return "No answers recorded for this session."
+  averages = score_averages(session)
+  return (
+    f"Average technical score: {averages['technical']:.1f}. "
+    f"Average communication score: {averages['communication']:.1f}. "
+    f"Average confidence score: {averages['confidence']:.1f}."
+  )
+
+
 @router.get("/interview/report/{session_id}", response_model=ReportRes)
-def report(session_id: str) -> ReportRes:
-  session = SESSIONS.get(session_id)
+async def report(session_id: str) -> ReportRes:
+  # Make sure deferred improved answers are embedded in the report
+  await _await_pending_questions(session_id)
+  await _await_pending_improvements(session_id)
+  # Persist queued session writes before the report is built from them
+  await SESSION_STORE.aflush()
+
+  session = await SESSION_STORE.aget(session_id)
   if not session:
     raise HTTPException(status_code=404, detail="Session not found")
 
@@ -194,35 +566,15 @@ def report(session_id: str) -> ReportRes:
   
   # Generate final report using OpenRouter
   try:
-    report_data = generate_final_report(session)
+    report_data = await generate_final_report_async(session)
     summary = report_data.get("overall_summary", "")
     if not summary:
       # Fallback to simple summary
-      if evals:
-        tech = sum(e.get("technical", 0) for e in evals) / len(evals)
-        comm = sum(e.get("communication", 0) for e in evals) / len(evals)
-        conf = sum(e.get("confidence", 0) for e in evals) / len(evals)
-        summary = (
-          f"Average technical score: {tech:.1f}. "
-          f"Average communication score: {comm:.1f}. "
-          f"Average confidence score: {conf:.1f}."
-        )
-      else:
-        summary = "No answers recorded for this session."
+      summary = _fallback_summary(session)
   except Exception as e:
     print(f"Error generating final report: {e}")
     # Fallback to simple summary
-    if evals:
-      tech = sum(e.get("technical", 0) for e in evals) / len(evals)
-      comm = sum(e.get("communication", 0) for e in evals) / len(evals)
-      conf = sum(e.get("confidence", 0) for e in evals) / len(evals)
-      summary = (
-        f"Average technical score: {tech:.1f}. "
-        f"Average communication score: {comm:.1f}. "
-        f"Average confidence score: {conf:.1f}."
-      )
-    else:
-      summary = "No answers recorded for this session."
+    summary = _fallback_summary(session)
 
   return ReportRes(
     session_id=session_id,
@@ -236,21 +588,35 @@ def report(session_id: str) -> ReportRes:
   )
 
 
+@router.get("/interview/report/{session_id}/stream")
+async def stream_report_summary(session_id: str) -> StreamingResponse:
+  """Stream the report's overall summary as Server-Sent Events (``token`` ... ``done``)."""
+  session = await SESSION_STORE.aget(session_id)
+  if not session:
+    raise HTTPException(status_code=404, detail="Session not found")
+
+  async def events() -> AsyncIterator[str]:
+    parts: List[str] = []
+    async for chunk in stream_report_summary_async(session):
+      parts.append(chunk)
+      yield _sse("token", {"text": chunk})
+    yield _sse("done", {"summary": "".join(parts).strip()})
+
+  return _sse_response(events())
+
+
 @router.get("/interview/reports", response_model=ReportListRes)
 def list_reports() -> ReportListRes:
   """List all interview sessions with metadata"""
   reports = []
   
-  for session_id, session in SESSIONS.items():
-    evals = session.get("evaluations", [])
-    
-    if evals:
-      tech = sum(e.get("technical", 0) for e in evals) / len(evals)
-      comm = sum(e.get("communication", 0) for e in evals) / len(evals)
-      conf = sum(e.get("confidence", 0) for e in evals) / len(evals)
-      overall = (tech + comm + conf) / 3
-    else:
-      tech = comm = conf = overall = 0.0
+  for session_id, session in SESSION_STORE.items():
+    # Running totals, so this is O(1) per session however many answers it has
+    averages = score_averages(session)
+    tech = averages["technical"]
+    comm = averages["communication"]
+    conf = averages["confidence"]
+    overall = (tech + comm + conf) / 3
     
     reports.append(ReportListItem(
       session_id=session_id,
@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime
 
 from app.models.interview import Interview
-from app.models.response import Response
+from app.models.response import Response, overall_score
 from app.models.report import Report
 from app.schemas.interview_schema import InterviewCreate
 from app.schemas.analysis_schema import AnswerSubmission, AnalysisResult
@@ -73,11 +73,7 @@ class InterviewService:
         communication_score = behavioral_analysis.get('communication_score', 0)
         confidence_score = behavioral_analysis.get('confidence_score', 0)
         
-        overall_score = (
-            technical_score * 0.4 +
-            communication_score * 0.35 + 
-            confidence_score * 0.25
-        )
+        overall = overall_score(technical_score, communication_score, confidence_score)
         
         # Generate interviewer response
         interviewer_response = self._generate_interviewer_response(
@@ -93,7 +89,7 @@ class InterviewService:
             technical_score=technical_score,
             communication_score=communication_score,
             confidence_score=confidence_score,
-            overall_score=overall_score,
+            overall_score=overall,
             analysis_data={
                 "technical_analysis": technical_analysis,
                 "behavioral_analysis": behavioral_analysis,
@@ -109,7 +105,7 @@ class InterviewService:
             technical_score=technical_score,
             communication_score=communication_score,
             confidence_score=confidence_score,
-            overall_score=overall_score,
+            overall_score=overall,
             feedback=technical_analysis.get('feedback', ''),
             interviewer_response=interviewer_response,
             detailed_analysis={
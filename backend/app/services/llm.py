@@ -8,8 +8,32 @@
 from typing import Optional, Dict, Any
 import logging
 
+from app.utils.keyword_matcher import KeywordHits
+from app.utils.text_utils import scan_answer
+
 logger = logging.getLogger(__name__)
 
+def basic_sentiment(text: str, hits: Optional[KeywordHits] = None, within: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Keyword sentiment: more positive than negative words present means POSITIVE.
+
+    Pass ``hits`` from ``scan_answer`` to reuse an existing scan; ``within``
+    limits it to keywords in the first N characters.
+    """
+    if hits is None:
+        hits = scan_answer(text)
+
+    pos_count = len(hits.found('positive', within))
+    neg_count = len(hits.found('negative', within))
+
+    if pos_count > neg_count:
+        return {"label": "POSITIVE", "score": 0.7, "confidence": 0.7}
+    elif neg_count > pos_count:
+        return {"label": "NEGATIVE", "score": 0.3, "confidence": 0.3}
+    else:
+        return {"label": "NEUTRAL", "score": 0.5, "confidence": 0.5}
+
+
 class LLMService:
     def __init__(self):
         # self.device = "cuda" if torch.cuda.is_available() else "cpu"  # Deprecated
@@ -41,20 +65,7 @@ class LLMService:
     def analyze_sentiment(self, text: str) -> Dict[str, Any]:
         """DEPRECATED: Basic sentiment analysis fallback"""
         logger.warning("LLMService.analyze_sentiment() is deprecated. Using basic fallback.")
-        # Simple fallback - check for positive/negative words
-        text_lower = text.lower()
-        positive_words = ['good', 'great', 'excellent', 'success', 'achieved', 'improved']
-        negative_words = ['bad', 'failed', 'difficult', 'challenge', 'problem', 'issue']
-        
-        pos_count = sum(1 for word in positive_words if word in text_lower)
-        neg_count = sum(1 for word in negative_words if word in text_lower)
-        
-        if pos_count > neg_count:
-            return {"label": "POSITIVE", "score": 0.7, "confidence": 0.7}
-        elif neg_count > pos_count:
-            return {"label": "NEGATIVE", "score": 0.3, "confidence": 0.3}
-        else:
-            return {"label": "NEUTRAL", "score": 0.5, "confidence": 0.5}
+        return basic_sentiment(text)
 
     def generate_feedback_summary(self, responses: list) -> str:
         """DEPRECATED: Use OpenRouter generate_final_report instead"""
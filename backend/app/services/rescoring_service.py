@@ -0,0 +1,274 @@
+# backend/app/services/rescoring_service.py
+import asyncio
+import json
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.ai_engines.openrouter_engine import evaluate_answers_batch_async, is_fallback_evaluation
+from app.config import get_settings
+from app.models.interview import Interview
+from app.models.response import Response, overall_score
+from app.services.session_store import refresh_score_totals
+
+settings = get_settings()
+
+
+class RescoringService:
+    """
+    Re-score stored ``Response`` rows with the current evaluation prompt/model.
+
+    Rows are read in keyset-paginated pages (``id > last_id``), so memory stays
+    bounded by ``page_size`` regardless of table size. Each answer is sent
+    with the same inputs as the live ``/interview/answer`` evaluation: the
+    question's ideal answer and expected keywords from ``Interview.questions``
+    and the candidate profile from ``Interview.session_state``. A page is
+    grouped by profile, evaluated through ``evaluate_answers_batch_async``
+    with at most ``concurrency`` batches in flight, and written back with one
+    bulk update that also recomputes ``score_totals`` of the page's
+    interviews. After every committed page the last id is saved to
+    ``checkpoint_path`` so an interrupted run can resume where it stopped.
+
+    Rows whose evaluation fell back to the baseline keep their old scores and
+    are recorded in the checkpoint's ``retry_ids``; each run ends with a pass
+    over them. If a whole page fails (upstream down or circuit open) the run
+    stops without advancing the checkpoint.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        checkpoint_path: str,
+        page_size: int = 200,
+        concurrency: int = 4,
+        dry_run: bool = False,
+    ):
+        self.db = db
+        self.checkpoint_path = checkpoint_path
+        self.page_size = page_size
+        self.concurrency = max(1, concurrency)
+        self.dry_run = dry_run
+
+    # ------------------------------------------------------------------
+    # Checkpoint
+    # ------------------------------------------------------------------
+    @staticmethod
+    def new_checkpoint() -> Dict[str, Any]:
+        return {"last_id": 0, "processed": 0, "updated": 0, "failed": 0, "retry_ids": []}
+
+    def load_checkpoint(self) -> Dict[str, Any]:
+        if not os.path.exists(self.checkpoint_path):
+            return self.new_checkpoint()
+        with open(self.checkpoint_path, "r", encoding="utf-8") as f:
+            checkpoint = json.load(f)
+        checkpoint.setdefault("retry_ids", [])
+        return checkpoint
+
+    def save_checkpoint(self, checkpoint: Dict[str, Any]) -> None:
+        directory = os.path.dirname(os.path.abspath(self.checkpoint_path))
+        os.makedirs(directory, exist_ok=True)
+        checkpoint["updated_at"] = datetime.utcnow().isoformat()
+        tmp_path = f"{self.checkpoint_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(checkpoint, f, indent=2)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    # ------------------------------------------------------------------
+    # Paging
+    # ------------------------------------------------------------------
+    def _rows(self):
+        return (
+            self.db.query(
+                Response.id,
+                Response.interview_id,
+                Response.question_index,
+                Response.question,
+                Response.answer_text,
+                Response.analysis_data,
+            )
+            .filter(Response.answer_text.isnot(None), Response.answer_text != "")
+        )
+
+    def fetch_page(self, after_id: int) -> List[Any]:
+        """Next ``page_size`` answered rows with ``id > after_id``."""
+        return (
+            self._rows()
+            .filter(Response.id > after_id)
+            .order_by(Response.id)
+            .limit(self.page_size)
+            .all()
+        )
+
+    def fetch_ids(self, ids: List[int]) -> List[Any]:
+        return self._rows().filter(Response.id.in_(ids)).order_by(Response.id).all()
+
+    def load_interviews(self, rows: List[Any]) -> Dict[int, Any]:
+        """Role, questions and session state of the interviews a page belongs to, by id."""
+        ids = {row.interview_id for row in rows if row.interview_id is not None}
+        if not ids:
+            return {}
+        interviews = (
+            self.db.query(Interview.id, Interview.role, Interview.questions, Interview.session_state)
+            .filter(Interview.id.in_(ids))
+            .all()
+        )
+        return {interview.id: interview for interview in interviews}
+
+    @staticmethod
+    def _question(row: Any, interview: Any) -> Dict[str, Any]:
+        """The stored question dict an answer belongs to ({} if only its text is known)."""
+        questions = (interview.questions if interview is not None else None) or []
+        question_id = (row.analysis_data or {}).get("question_id")
+        if question_id is not None:
+            for question in questions:
+                if isinstance(question, dict) and str(question.get("id")) == str(question_id):
+                    return question
+        index = row.question_index
+        if index is not None and 0 <= index < len(questions) and isinstance(questions[index], dict):
+            return questions[index]
+        return {}
+
+    @staticmethod
+    def _profile(interview: Any) -> Dict[str, Any]:
+        state = (interview.session_state if interview is not None else None) or {}
+        profile = dict(state.get("profile") or {})
+        role = interview.role if interview is not None else None
+        profile["role"] = profile.get("role") or role or "Software Engineer"
+        return profile
+
+    # ------------------------------------------------------------------
+    # Evaluation
+    # ------------------------------------------------------------------
+    async def evaluate_page(self, rows: List[Any]) -> Dict[int, Dict[str, Any]]:
+        """Evaluate a page of rows; returns ``{response_id: evaluation}``."""
+        interviews = self.load_interviews(rows)
+
+        # One batch shares one profile; group on what the prompt uses of it
+        groups: Dict[str, Tuple[Dict[str, Any], List[Tuple[Any, Dict[str, Any]]]]] = {}
+        for row in rows:
+            interview = interviews.get(row.interview_id)
+            profile = self._profile(interview)
+            group_key = json.dumps([profile["role"], list(profile.get("skills") or [])[:5]], default=str)
+            item = {
+                "question_text": row.question or "",
+                "transcript": row.answer_text,
+                "ideal_answer": self._question(row, interview).get("ideal_answer", ""),
+                "expected_keywords": self._question(row, interview).get("expected_keywords", []),
+            }
+            groups.setdefault(group_key, (profile, []))[1].append((row, item))
+
+        batch_size = max(1, settings.OPENROUTER_EVAL_BATCH_SIZE)
+        jobs: List[Tuple[Dict[str, Any], List[Tuple[Any, Dict[str, Any]]]]] = []
+        for profile, members in groups.values():
+            for start in range(0, len(members), batch_size):
+                jobs.append((profile, members[start:start + batch_size]))
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run(
+            profile: Dict[str, Any], batch: List[Tuple[Any, Dict[str, Any]]]
+        ) -> List[Tuple[int, Dict[str, Any]]]:
+            async with semaphore:
+                evaluations = await evaluate_answers_batch_async([item for _, item in batch], profile)
+            return [(row.id, evaluation) for (row, _), evaluation in zip(batch, evaluations)]
+
+        results: Dict[int, Dict[str, Any]] = {}
+        for pairs in await asyncio.gather(*(run(profile, batch) for profile, batch in jobs)):
+            results.update(pairs)
+        return results
+
+    async def score_rows(self, rows: List[Any]) -> Tuple[List[Dict[str, Any]], List[int]]:
+        """Evaluate rows and write the usable results; returns ``(updates, fallen_back_ids)``."""
+        evaluations = await self.evaluate_page(rows)
+        updates = []
+        failed = []
+        for row in rows:
+            evaluation = evaluations.get(row.id)
+            if evaluation is not None and not is_fallback_evaluation(evaluation):
+                updates.append(self.build_update(row, evaluation))
+            else:
+                failed.append(row.id)
+        if updates and not self.dry_run:
+            self.db.bulk_update_mappings(Response, updates)
+            refresh_score_totals(self.db, {row.interview_id for row in rows})
+            self.db.commit()
+        return updates, failed
+
+    @staticmethod
+    def build_update(row: Any, evaluation: Dict[str, Any]) -> Dict[str, Any]:
+        technical = float(evaluation["technical"])
+        communication = float(evaluation["communication"])
+        confidence = float(evaluation["confidence"])
+        analysis_data = dict(row.analysis_data or {})
+        analysis_data["llm_evaluation"] = evaluation
+        analysis_data["rescored_at"] = datetime.utcnow().isoformat()
+        return {
+            "id": row.id,
+            "technical_score": technical,
+            "communication_score": communication,
+            "confidence_score": confidence,
+            "overall_score": overall_score(technical, communication, confidence),
+            "analysis_data": analysis_data,
+        }
+
+    # ------------------------------------------------------------------
+    # Driver
+    # ------------------------------------------------------------------
+    async def run(self, resume: bool = True, limit: Optional[int] = None) -> Dict[str, Any]:
+        checkpoint = self.load_checkpoint() if resume else self.new_checkpoint()
+        checkpoint["aborted"] = False
+        seen = 0
+        if checkpoint["last_id"]:
+            print(f"↩️ Resuming re-scoring after response id {checkpoint['last_id']}")
+
+        while limit is None or seen < limit:
+            rows = self.fetch_page(checkpoint["last_id"])
+            if limit is not None:
+                rows = rows[: limit - seen]
+            if not rows:
+                break
+
+            updates, failed = await self.score_rows(rows)
+            if not updates:
+                print(f"❌ No rows in page after id {checkpoint['last_id']} could be scored; stopping")
+                checkpoint["aborted"] = True
+                break
+
+            seen += len(rows)
+            checkpoint["last_id"] = rows[-1].id
+            checkpoint["processed"] += len(rows)
+            checkpoint["updated"] += len(updates)
+            checkpoint["retry_ids"].extend(failed)
+            checkpoint["failed"] = len(checkpoint["retry_ids"])
+            if not self.dry_run:
+                self.save_checkpoint(checkpoint)
+            print(
+                f"✅ Re-scored {len(updates)}/{len(rows)} rows up to id {checkpoint['last_id']} "
+                f"(total {checkpoint['updated']} updated, {checkpoint['failed']} queued for retry)"
+            )
+
+        if not checkpoint["aborted"] and checkpoint["retry_ids"]:
+            await self.retry_failed(checkpoint)
+        return checkpoint
+
+    async def retry_failed(self, checkpoint: Dict[str, Any]) -> None:
+        """One more attempt at rows whose evaluation fell back; those still failing stay queued."""
+        queued = list(checkpoint["retry_ids"])
+        print(f"🔁 Retrying {len(queued)} rows that fell back to the baseline")
+        still_failing: List[int] = []
+        for start in range(0, len(queued), self.page_size):
+            # Ids whose rows were deleted or emptied since are simply not fetched again
+            rows = self.fetch_ids(queued[start:start + self.page_size])
+            updates, failed = await self.score_rows(rows)
+            checkpoint["updated"] += len(updates)
+            still_failing.extend(failed)
+            rest = queued[start + self.page_size:]
+            checkpoint["retry_ids"] = still_failing + rest
+            checkpoint["failed"] = len(checkpoint["retry_ids"])
+            if not self.dry_run:
+                self.save_checkpoint(checkpoint)
+            if failed and not updates:
+                print(f"❌ Retry pass made no progress; {checkpoint['failed']} rows stay queued")
+                break
@@ -6,6 +6,75 @@ from datetime import datetime
 from typing import Dict, Any, List
 from app.models.resume import Resume
 from sqlalchemy.orm import Session
+from app.utils.keyword_matcher import KeywordMatcher
+
+# Comprehensive skill database
+SKILL_KEYWORDS = frozenset({
+    # Programming Languages
+    'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'c', 'go', 'rust', 'kotlin', 
+    'swift', 'php', 'ruby', 'scala', 'r', 'matlab', 'perl', 'shell', 'bash', 'powershell',
+    # Web Technologies
+    'react', 'angular', 'vue', 'next.js', 'nuxt', 'svelte', 'ember', 'jquery', 'html', 'css',
+    'sass', 'scss', 'less', 'webpack', 'vite', 'babel', 'es6', 'typescript', 'jsx',
+    # Backend Frameworks
+    'node.js', 'express', 'nestjs', 'django', 'flask', 'fastapi', 'spring', 'spring boot',
+    'laravel', 'symfony', 'rails', 'asp.net', 'dotnet', '.net', 'gin', 'echo',
+    # Databases
+    'sql', 'mysql', 'postgresql', 'postgres', 'mongodb', 'redis', 'cassandra', 'elasticsearch',
+    'dynamodb', 'oracle', 'sqlite', 'mariadb', 'neo4j', 'couchdb', 'firebase',
+    # Cloud & DevOps
+    'aws', 'azure', 'gcp', 'google cloud', 'docker', 'kubernetes', 'k8s', 'terraform',
+    'ansible', 'jenkins', 'ci/cd', 'github actions', 'gitlab ci', 'circleci', 'travis',
+    'nginx', 'apache', 'linux', 'unix', 'bash scripting',
+    # ML/AI
+    'machine learning', 'deep learning', 'neural networks', 'tensorflow', 'pytorch', 'keras',
+    'scikit-learn', 'pandas', 'numpy', 'matplotlib', 'seaborn', 'opencv', 'nltk', 'spacy',
+    'nlp', 'computer vision', 'reinforcement learning', 'xgboost', 'lightgbm',
+    # Data Science
+    'data analysis', 'data science', 'data visualization', 'tableau', 'power bi', 'looker',
+    'qlik', 'excel', 'vba', 'sql', 'spark', 'hadoop', 'hive', 'pig', 'kafka',
+    # Mobile
+    'android', 'ios', 'react native', 'flutter', 'xamarin', 'ionic', 'swift', 'kotlin',
+    # Tools & Others
+    'git', 'svn', 'mercurial', 'jira', 'confluence', 'agile', 'scrum', 'kanban',
+    'microservices', 'rest api', 'graphql', 'grpc', 'soap', 'oauth', 'jwt',
+    'project management', 'leadership', 'communication', 'team collaboration'
+})
+
+# Alternate spellings, reported under the canonical skill name
+SKILL_ALIASES = {
+    'k8s': 'kubernetes',
+    'postgres': 'postgresql',
+    'dotnet': '.net',
+    'golang': 'go',
+    'nodejs': 'node.js',
+    'reactjs': 'react',
+    'react.js': 'react',
+    'vuejs': 'vue',
+    'vue.js': 'vue',
+    'nextjs': 'next.js',
+    'angularjs': 'angular',
+    'sklearn': 'scikit-learn',
+    'mongo': 'mongodb',
+    'gcloud': 'google cloud',
+    'ml': 'machine learning',
+    'ci cd': 'ci/cd',
+    'cicd': 'ci/cd',
+    'restful api': 'rest api',
+}
+
+# Compiled once: one pass over the text finds every skill and alias as a whole
+# word ("skill"), and every known skill appearing anywhere ("skill_substring")
+_SKILL_MATCHER = KeywordMatcher(
+    {
+        'skill': list(SKILL_KEYWORDS) + list(SKILL_ALIASES),
+        'skill_substring': SKILL_KEYWORDS,
+    },
+    whole_words=['skill'],
+)
+# Lets "is this piece part of a known skill" be a single substring test
+_SKILL_TEXT = "\n".join(sorted(SKILL_KEYWORDS))
+
 
 class ResumeService:
     def __init__(self, db: Session):
@@ -79,39 +148,6 @@ class ResumeService:
     
     def _extract_skills(self, text: str) -> List[str]:
         """Extract skills from resume text using advanced techniques"""
-        # Comprehensive skill database
-        skill_keywords = {
-            # Programming Languages
-            'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'c', 'go', 'rust', 'kotlin', 
-            'swift', 'php', 'ruby', 'scala', 'r', 'matlab', 'perl', 'shell', 'bash', 'powershell',
-            # Web Technologies
-            'react', 'angular', 'vue', 'next.js', 'nuxt', 'svelte', 'ember', 'jquery', 'html', 'css',
-            'sass', 'scss', 'less', 'webpack', 'vite', 'babel', 'es6', 'typescript', 'jsx',
-            # Backend Frameworks
-            'node.js', 'express', 'nestjs', 'django', 'flask', 'fastapi', 'spring', 'spring boot',
-            'laravel', 'symfony', 'rails', 'asp.net', 'dotnet', '.net', 'gin', 'echo',
-            # Databases
-            'sql', 'mysql', 'postgresql', 'postgres', 'mongodb', 'redis', 'cassandra', 'elasticsearch',
-            'dynamodb', 'oracle', 'sqlite', 'mariadb', 'neo4j', 'couchdb', 'firebase',
-            # Cloud & DevOps
-            'aws', 'azure', 'gcp', 'google cloud', 'docker', 'kubernetes', 'k8s', 'terraform',
-            'ansible', 'jenkins', 'ci/cd', 'github actions', 'gitlab ci', 'circleci', 'travis',
-            'nginx', 'apache', 'linux', 'unix', 'bash scripting',
-            # ML/AI
-            'machine learning', 'deep learning', 'neural networks', 'tensorflow', 'pytorch', 'keras',
-            'scikit-learn', 'pandas', 'numpy', 'matplotlib', 'seaborn', 'opencv', 'nltk', 'spacy',
-            'nlp', 'computer vision', 'reinforcement learning', 'xgboost', 'lightgbm',
-            # Data Science
-            'data analysis', 'data science', 'data visualization', 'tableau', 'power bi', 'looker',
-            'qlik', 'excel', 'vba', 'sql', 'spark', 'hadoop', 'hive', 'pig', 'kafka',
-            # Mobile
-            'android', 'ios', 'react native', 'flutter', 'xamarin', 'ionic', 'swift', 'kotlin',
-            # Tools & Others
-            'git', 'svn', 'mercurial', 'jira', 'confluence', 'agile', 'scrum', 'kanban',
-            'microservices', 'rest api', 'graphql', 'grpc', 'soap', 'oauth', 'jwt',
-            'project management', 'leadership', 'communication', 'team collaboration'
-        }
-        
         found_skills = []
         text_lower = text.lower()
         lines = text.split('\n')
@@ -140,14 +176,10 @@ class ResumeService:
         # Search in skills section first, then whole text
         search_text = skills_section_text if skills_section_text else text_lower
         
-        # Extract skills using keyword matching
-        for skill in skill_keywords:
-            # Use word boundaries for better matching
-            pattern = r'\b' + re.escape(skill.lower()) + r'\b'
-            if re.search(pattern, search_text):
-                # Format skill name properly
-                skill_name = skill.title() if len(skill.split()) == 1 else skill.title()
-                found_skills.append(skill_name)
+        # One scan finds every known skill and alias, in order of appearance
+        hits = _SKILL_MATCHER.scan(search_text)
+        for skill in hits.first_seen('skill'):
+            found_skills.append(SKILL_ALIASES.get(skill, skill).title())
         
         # Also extract skills mentioned in comma-separated lists
         skill_list_pattern = r'(?:skills?|technologies?|tools?)[\s:]+([^\.\n]{10,200})'
@@ -158,11 +190,9 @@ class ResumeService:
             for potential_skill in potential_skills:
                 skill_clean = potential_skill.strip()
                 if len(skill_clean) > 2 and len(skill_clean) < 30:
-                    # Check if it matches any known skill
-                    for known_skill in skill_keywords:
-                        if known_skill.lower() in skill_clean.lower() or skill_clean.lower() in known_skill.lower():
-                            found_skills.append(skill_clean.title())
-                            break
+                    # Check if it contains a known skill or is part of one
+                    if _SKILL_MATCHER.scan(skill_clean).any('skill_substring') or skill_clean in _SKILL_TEXT:
+                        found_skills.append(SKILL_ALIASES.get(skill_clean, skill_clean).title())
         
         # Remove duplicates and return
         unique_skills = []
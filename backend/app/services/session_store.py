@@ -0,0 +1,793 @@
+# backend/app/services/session_store.py
+import asyncio
+import hashlib
+from abc import ABC, abstractmethod
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+
+from app.config import get_settings
+from app.database import SessionLocal, engine, ensure_schema
+from app.models.interview import Interview
+from app.models.response import Response, overall_score
+
+settings = get_settings()
+
+SessionData = Dict[str, Any]
+# (kind, session_id, payload), see DatabaseSessionStore.apply
+Op = Tuple[str, str, Any]
+
+# Longest pause between write-behind flushes while they keep failing
+_MAX_FLUSH_BACKOFF = 60.0
+
+# Session fields kept in Interview.session_state; the rest map onto columns or
+# Response rows, and question_vectors are rebuilt lazily by the routes.
+_STATE_KEYS = ("profile", "persona", "created_at", "started_at", "extra_metrics")
+
+_SCORE_FIELDS = ("technical", "communication", "confidence")
+
+_ROUND_TYPES = {
+    "behavioral": "hr_round",
+    "technical": "technical_round",
+    "mixed": "final_round",
+}
+
+
+class DuplicateAnswerError(Exception):
+    """The session already has a stored answer with the same dedupe key."""
+
+
+def answer_dedupe_key(record: Dict[str, Any]) -> str:
+    """
+    Key two submissions of one answer share: the client's idempotency key, or
+    else the question id and transcript (resending the same answer is a retry).
+    """
+    if record.get("idempotency_key"):
+        return f"key:{record['idempotency_key']}"
+    content = f"{record.get('question_id')}\0{record.get('transcript') or ''}"
+    return "answer:" + hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _index_question(session: SessionData, index: int, question: Dict[str, Any]) -> None:
+    # question_id -> (position, question), so lookups by id never scan the list
+    session.setdefault("question_index", {})[str(question.get("id"))] = (index, question)
+
+
+def find_question(session: SessionData, question_id: Any) -> Optional[Tuple[int, Dict[str, Any]]]:
+    """``(position, question)`` for a question id of the session, or None."""
+    return session.get("question_index", {}).get(str(question_id))
+
+
+def _add_scores(totals: Dict[str, Any], evaluation: Dict[str, Any]) -> None:
+    totals["count"] += 1
+    for field in _SCORE_FIELDS:
+        value = float(evaluation.get(field, 0) or 0)
+        stats = totals[field]
+        stats["sum"] += value
+        stats["min"] = value if stats["min"] is None else min(stats["min"], value)
+        stats["max"] = value if stats["max"] is None else max(stats["max"], value)
+
+
+def score_totals(session: SessionData) -> Dict[str, Any]:
+    """
+    Running count and per-score sum/min/max of the session's evaluations.
+
+    Kept up to date by ``SessionStore.add_answer``; built once from
+    ``session["evaluations"]`` for sessions loaded without it.
+    """
+    totals = session.get("score_totals")
+    if totals is None:
+        totals = {"count": 0}
+        for field in _SCORE_FIELDS:
+            totals[field] = {"sum": 0.0, "min": None, "max": None}
+        for evaluation in session.get("evaluations", []):
+            _add_scores(totals, evaluation)
+        session["score_totals"] = totals
+    return totals
+
+
+def score_averages(session: SessionData) -> Dict[str, float]:
+    """Average technical/communication/confidence score (0.0 without evaluations)."""
+    totals = score_totals(session)
+    count = totals["count"]
+    return {field: totals[field]["sum"] / count if count else 0.0 for field in _SCORE_FIELDS}
+
+
+def aggregate_score_totals(db, interview_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+    """``score_totals`` of interviews from their Response rows, in one grouped query."""
+    if not interview_ids:
+        return {}
+    aggregates = [Response.interview_id, func.count(Response.id)]
+    for field in _SCORE_FIELDS:
+        column = getattr(Response, f"{field}_score")
+        aggregates += [func.sum(column), func.min(column), func.max(column)]
+    rows = (
+        db.query(*aggregates)
+        .filter(Response.interview_id.in_(interview_ids))
+        .group_by(Response.interview_id)
+        .all()
+    )
+    totals = {}
+    for interview_id, count, *values in rows:
+        entry: Dict[str, Any] = {"count": count}
+        for position, field in enumerate(_SCORE_FIELDS):
+            total, low, high = values[3 * position:3 * position + 3]
+            entry[field] = {
+                "sum": float(total or 0.0),
+                "min": None if low is None else float(low),
+                "max": None if high is None else float(high),
+            }
+        totals[interview_id] = entry
+    return totals
+
+
+def refresh_score_totals(db, interview_ids: Iterable[int]) -> None:
+    """
+    Recompute ``Interview.score_totals`` from the Response rows, inside the
+    caller's transaction. Totals are never carried over from a session a
+    process loaded earlier, so concurrent writers cannot lose each other's
+    answers; callers that insert or rescore rows call this before committing.
+    """
+    interview_ids = [interview_id for interview_id in interview_ids if interview_id is not None]
+    if not interview_ids:
+        return
+    db.flush()
+    totals = aggregate_score_totals(db, interview_ids)
+    for interview_id in interview_ids:
+        db.query(Interview).filter(Interview.id == interview_id).update(
+            {Interview.score_totals: totals.get(interview_id) or score_totals({})},
+            synchronize_session=False,
+        )
+
+
+class SessionStore(ABC):
+    """
+    Storage for the live sessions of the /api/interview routes.
+
+    Sessions are plain dicts. Routes read them with ``get`` and change them
+    only through the mutation methods below, which update the dict and then
+    persist just that change, so a backend never has to rewrite a whole
+    session per answer. Async routes use the ``a``-prefixed variants, which
+    run the call in a worker thread for stores that do I/O (``blocking``).
+    Backends implement the abstract methods; the mutation methods have
+    in-memory defaults that persisting stores extend.
+    """
+
+    # True for stores whose methods wait on the database
+    blocking = False
+
+    @abstractmethod
+    def get(self, session_id: str) -> Optional[SessionData]:
+        """The session, or None if it does not exist (or has expired)."""
+
+    @abstractmethod
+    def create(self, session_id: str, session: SessionData) -> None:
+        """Store a new session."""
+
+    @abstractmethod
+    def delete(self, session_id: str) -> None:
+        """Remove a session; unknown ids are ignored."""
+
+    @abstractmethod
+    def items(self) -> List[Tuple[str, SessionData]]:
+        """
+        All live sessions, for listing. Stores may return summaries holding only
+        role, interview_type, created_at, questions and score_totals.
+        """
+
+    def add_question(self, session_id: str, session: SessionData, question: Dict[str, Any]) -> None:
+        session["questions"].append(question)
+        _index_question(session, len(session["questions"]) - 1, question)
+
+    def add_answer(self, session_id: str, session: SessionData, record: Dict[str, Any]) -> int:
+        """Append an answer record and its evaluation; returns the answer's index."""
+        # Stable id of the answer, so later updates find its row in any worker
+        record.setdefault("answer_id", uuid.uuid4().hex)
+        totals = score_totals(session)
+        session["answers"].append(record)
+        session["evaluations"].append(record["evaluation"])
+        _add_scores(totals, record["evaluation"])
+        return len(session["answers"]) - 1
+
+    def update_answer(self, session_id: str, session: SessionData, index: int) -> None:
+        """Persist changes made in place to ``session["answers"][index]``."""
+
+    def add_metrics(self, session_id: str, session: SessionData, entry: Dict[str, Any]) -> None:
+        session.setdefault("extra_metrics", []).append(entry)
+
+    def flush(self) -> int:
+        """Write out anything buffered; returns how many writes were flushed."""
+        return 0
+
+    async def _call(self, method, *args):
+        if self.blocking:
+            return await asyncio.to_thread(method, *args)
+        return method(*args)
+
+    async def aget(self, session_id: str) -> Optional[SessionData]:
+        return await self._call(self.get, session_id)
+
+    async def acreate(self, session_id: str, session: SessionData) -> None:
+        await self._call(self.create, session_id, session)
+
+    async def aadd_question(self, session_id: str, session: SessionData, question: Dict[str, Any]) -> None:
+        await self._call(self.add_question, session_id, session, question)
+
+    async def aadd_answer(self, session_id: str, session: SessionData, record: Dict[str, Any]) -> int:
+        return await self._call(self.add_answer, session_id, session, record)
+
+    async def aupdate_answer(self, session_id: str, session: SessionData, index: int) -> None:
+        await self._call(self.update_answer, session_id, session, index)
+
+    async def aadd_metrics(self, session_id: str, session: SessionData, entry: Dict[str, Any]) -> None:
+        await self._call(self.add_metrics, session_id, session, entry)
+
+    async def aflush(self) -> int:
+        return await self._call(self.flush)
+
+    async def start(self) -> None:
+        """Start background work (app startup)."""
+
+    async def aclose(self) -> None:
+        """Stop background work and flush (app shutdown)."""
+
+
+class InMemorySessionStore(SessionStore):
+    """
+    Process-local store with idle expiry and a size cap.
+
+    Sessions untouched for ``ttl_seconds`` are dropped, and once more than
+    ``max_sessions`` are held the least recently used ones are evicted.
+    Entries are kept in last-touched order, so both checks only ever look at
+    the front of the dict.
+    """
+
+    def __init__(self, ttl_seconds: float, max_sessions: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_sessions = max(1, max_sessions)
+        self._sessions: "OrderedDict[str, Tuple[float, SessionData]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def _evict(self, now: float) -> None:
+        while self._sessions:
+            touched, _ = next(iter(self._sessions.values()))
+            if now - touched < self.ttl_seconds and len(self._sessions) <= self.max_sessions:
+                break
+            self._sessions.popitem(last=False)
+            self.evictions += 1
+
+    def _touch(self, session_id: str, session: SessionData) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._sessions[session_id] = (now, session)
+            self._sessions.move_to_end(session_id)
+            self._evict(now)
+
+    def get(self, session_id: str) -> Optional[SessionData]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is None:
+                return None
+            if now - entry[0] >= self.ttl_seconds:
+                del self._sessions[session_id]
+                self.evictions += 1
+                return None
+            self._sessions[session_id] = (now, entry[1])
+            self._sessions.move_to_end(session_id)
+            return entry[1]
+
+    def create(self, session_id: str, session: SessionData) -> None:
+        self._touch(session_id, session)
+
+    def delete(self, session_id: str) -> None:
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def items(self) -> List[Tuple[str, SessionData]]:
+        with self._lock:
+            self._evict(time.monotonic())
+            return [(session_id, session) for session_id, (_, session) in self._sessions.items()]
+
+    def add_question(self, session_id: str, session: SessionData, question: Dict[str, Any]) -> None:
+        super().add_question(session_id, session, question)
+        self._touch(session_id, session)
+
+    def add_answer(self, session_id: str, session: SessionData, record: Dict[str, Any]) -> int:
+        index = super().add_answer(session_id, session, record)
+        self._touch(session_id, session)
+        return index
+
+    def add_metrics(self, session_id: str, session: SessionData, entry: Dict[str, Any]) -> None:
+        super().add_metrics(session_id, session, entry)
+        self._touch(session_id, session)
+
+
+class DatabaseSessionStore(SessionStore):
+    """
+    Durable store shared by every worker and node using the same database.
+
+    A session is one ``Interview`` row (questions in ``questions``, profile,
+    persona and metrics in ``session_state``) plus one ``Response`` row per
+    answer, with the evaluation, metrics and improved answer in
+    ``analysis_data``. Each read loads the current rows, so any worker can
+    serve any request of a session. ``Interview.score_totals`` is recomputed
+    from the responses whenever one is written (``refresh_score_totals``), so
+    ``items`` lists sessions without loading their responses. A unique ``(interview_id, dedupe_key)`` index
+    stops two workers storing the same answer; the losing insert raises
+    ``DuplicateAnswerError``.
+    """
+
+    blocking = True
+
+    def __init__(self, bind=None):
+        self._engine = bind or engine
+        self._session_factory = SessionLocal if bind is None else sessionmaker(
+            autocommit=False, autoflush=False, bind=bind
+        )
+        ensure_schema(self._engine)
+
+    # ------------------------------------------------------------------
+    # Row mapping
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _state(session: SessionData) -> Dict[str, Any]:
+        state = {key: session[key] for key in _STATE_KEYS if key in session}
+        # Snapshot: the session's own list keeps changing after an op is queued
+        if "extra_metrics" in state:
+            state["extra_metrics"] = list(state["extra_metrics"])
+        return state
+
+    @staticmethod
+    def _response_fields(session: SessionData, record: Dict[str, Any]) -> Dict[str, Any]:
+        evaluation = record.get("evaluation") or {}
+        technical = float(evaluation.get("technical", 0) or 0)
+        communication = float(evaluation.get("communication", 0) or 0)
+        confidence = float(evaluation.get("confidence", 0) or 0)
+        found = find_question(session, record.get("question_id"))
+        return {
+            "question_index": found[0] if found else None,
+            "question": record.get("question") or "",
+            "answer_text": record.get("transcript"),
+            "technical_score": technical,
+            "communication_score": communication,
+            "confidence_score": confidence,
+            "overall_score": overall_score(technical, communication, confidence),
+            "dedupe_key": answer_dedupe_key(record),
+            "analysis_data": {
+                "answer_id": record.get("answer_id"),
+                "question_id": record.get("question_id"),
+                "metrics": record.get("metrics") or {},
+                "llm_evaluation": evaluation,
+                "improved": record.get("improved", ""),
+                "improved_status": record.get("improved_status", "ready"),
+                "idempotency_key": record.get("idempotency_key"),
+            },
+        }
+
+    @staticmethod
+    def _answer_record(response: Response) -> Dict[str, Any]:
+        data = response.analysis_data or {}
+        record = {
+            # Rows written before answers had ids are addressed by their primary key
+            "answer_id": data.get("answer_id") or f"response:{response.id}",
+            "question_id": data.get("question_id"),
+            "question": response.question,
+            "transcript": response.answer_text or "",
+            "metrics": data.get("metrics") or {},
+            "evaluation": data.get("llm_evaluation") or {},
+            "improved": data.get("improved", ""),
+            "improved_status": data.get("improved_status", "ready"),
+        }
+        if data.get("idempotency_key"):
+            record["idempotency_key"] = data["idempotency_key"]
+        return record
+
+    def _to_session(self, interview: Interview, responses: List[Response]) -> SessionData:
+        answers = [self._answer_record(response) for response in responses]
+        state = interview.session_state or {}
+        session: SessionData = {key: state[key] for key in _STATE_KEYS if key in state}
+        session.update(
+            role=interview.role,
+            interview_type=interview.interview_type,
+            questions=list(interview.questions or []),
+            question_index={},
+            question_vectors={},
+            answers=answers,
+            evaluations=[answer["evaluation"] for answer in answers],
+            current_question_index=interview.current_question_index or 0,
+        )
+        for index, question in enumerate(session["questions"]):
+            _index_question(session, index, question)
+        return session
+
+    @staticmethod
+    def _responses(db, interview_ids: List[int]) -> List[Response]:
+        if not interview_ids:
+            return []
+        return (
+            db.query(Response)
+            .filter(Response.interview_id.in_(interview_ids))
+            .order_by(Response.interview_id, Response.id)
+            .all()
+        )
+
+    @staticmethod
+    def _interview(db, session_id: str, lock: bool = False) -> Optional[Interview]:
+        query = db.query(Interview).filter(Interview.session_id == session_id)
+        if lock:
+            # Row lock where the database has one; SQLite serialises writers anyway
+            query = query.with_for_update()
+        return query.first()
+
+    def _response(self, db, interview: Interview, answer_id: str) -> Optional[Response]:
+        """The row of an answer, by its ``answer_id``."""
+        if answer_id.startswith("response:"):
+            response = db.get(Response, int(answer_id.split(":", 1)[1]))
+            return response if response is not None and response.interview_id == interview.id else None
+        for response in self._responses(db, [interview.id]):
+            if (response.analysis_data or {}).get("answer_id") == answer_id:
+                return response
+        return None
+
+    # ------------------------------------------------------------------
+    # SessionStore
+    # ------------------------------------------------------------------
+    def get(self, session_id: str) -> Optional[SessionData]:
+        with self._session_factory() as db:
+            interview = self._interview(db, session_id)
+            if interview is None or interview.session_state is None:
+                return None
+            return self._to_session(interview, self._responses(db, [interview.id]))
+
+    def items(self) -> List[Tuple[str, SessionData]]:
+        """Listing summaries; Response rows are only aggregated for sessions saved without totals."""
+        with self._session_factory() as db:
+            interviews = (
+                db.query(
+                    Interview.id,
+                    Interview.session_id,
+                    Interview.role,
+                    Interview.interview_type,
+                    Interview.questions,
+                    Interview.session_state,
+                    Interview.score_totals,
+                )
+                .filter(Interview.session_state.isnot(None))
+                .all()
+            )
+            legacy = [row.id for row in interviews if not row.score_totals]
+            totals = aggregate_score_totals(db, legacy)
+            summaries = []
+            for row in interviews:
+                state = row.session_state
+                summary: SessionData = {
+                    "role": row.role,
+                    "interview_type": row.interview_type,
+                    "questions": list(row.questions or []),
+                    "score_totals": row.score_totals or totals.get(row.id) or score_totals({}),
+                }
+                if "created_at" in state:
+                    summary["created_at"] = state["created_at"]
+                summaries.append((row.session_id, summary))
+            return summaries
+
+    def create(self, session_id: str, session: SessionData) -> None:
+        self.apply([self.create_op(session_id, session)])
+
+    def delete(self, session_id: str) -> None:
+        self.apply([("delete", session_id, None)])
+
+    def add_question(self, session_id: str, session: SessionData, question: Dict[str, Any]) -> None:
+        super().add_question(session_id, session, question)
+        self.apply([self.questions_op(session_id, session)])
+
+    def add_answer(self, session_id: str, session: SessionData, record: Dict[str, Any]) -> int:
+        index = super().add_answer(session_id, session, record)
+        self.apply([self.answer_op(session_id, session, index)])
+        return index
+
+    def update_answer(self, session_id: str, session: SessionData, index: int) -> None:
+        self.apply([self.answer_op(session_id, session, index, update=True)])
+
+    def add_metrics(self, session_id: str, session: SessionData, entry: Dict[str, Any]) -> None:
+        super().add_metrics(session_id, session, entry)
+        self.apply([self.state_op(session_id, session)])
+
+    # ------------------------------------------------------------------
+    # Write ops
+    # ------------------------------------------------------------------
+    # Every write is an op ``(kind, session_id, payload)`` whose payload is a
+    # snapshot taken when the change was made, so ops can be queued and many
+    # applied in one transaction (see WriteBehindSessionStore).
+    def create_op(self, session_id: str, session: SessionData) -> Op:
+        interview_type = session.get("interview_type") or "mixed"
+        return ("create", session_id, {
+            "role": session.get("role") or "Software Engineer",
+            "interview_type": interview_type,
+            "round_type": _ROUND_TYPES.get(interview_type, "final_round"),
+            "questions": list(session.get("questions", [])),
+            "answers": [],
+            "current_question_index": session.get("current_question_index", 0),
+            "session_state": self._state(session),
+        })
+
+    def questions_op(self, session_id: str, session: SessionData) -> Op:
+        return ("questions", session_id, list(session["questions"]))
+
+    def answer_op(self, session_id: str, session: SessionData, index: int, update: bool = False) -> Op:
+        record = session["answers"][index]
+        return ("update_answer" if update else "answer", session_id, {
+            "answer_id": record["answer_id"],
+            "count": len(session["answers"]),
+            "fields": self._response_fields(session, record),
+        })
+
+    def state_op(self, session_id: str, session: SessionData) -> Op:
+        return ("state", session_id, self._state(session))
+
+    def apply(self, ops: List[Op]) -> None:
+        """Apply ops in order and commit them together."""
+        with self._session_factory() as db:
+            interviews: Dict[str, Optional[Interview]] = {}
+            scored: Set[int] = set()
+            for kind, session_id, payload in ops:
+                if session_id not in interviews:
+                    interviews[session_id] = self._interview(db, session_id, lock=True)
+                interview = interviews[session_id]
+
+                if kind == "create":
+                    if interview is None:
+                        interview = Interview(session_id=session_id, **payload)
+                        db.add(interview)
+                        interviews[session_id] = interview
+                    continue
+                if interview is None:
+                    continue
+
+                if kind == "questions":
+                    interview.questions = payload
+                elif kind == "state":
+                    interview.session_state = payload
+                elif kind == "answer":
+                    db.add(Response(interview=interview, **payload["fields"]))
+                    try:
+                        db.flush()
+                    except IntegrityError as e:
+                        # Same answer recorded by another worker (unique dedupe_key)
+                        db.rollback()
+                        raise DuplicateAnswerError(session_id) from e
+                    interview.current_question_index = payload["count"]
+                    scored.add(interview.id)
+                elif kind == "update_answer":
+                    db.flush()
+                    response = self._response(db, interview, payload["answer_id"])
+                    if response is not None:
+                        for field, value in payload["fields"].items():
+                            setattr(response, field, value)
+                        scored.add(interview.id)
+                elif kind == "delete":
+                    db.flush()
+                    db.query(Response).filter(Response.interview_id == interview.id).delete()
+                    scored.discard(interview.id)
+                    db.delete(interview)
+                    interviews[session_id] = None
+            # Same transaction as the rows, from what is stored rather than a snapshot
+            refresh_score_totals(db, scored)
+            db.commit()
+
+
+class WriteBehindSessionStore(SessionStore):
+    """
+    ``DatabaseSessionStore`` with the database writes taken off the request path.
+
+    Mutations update the session in this worker's cache and queue a snapshot
+    op. A background task applies queued ops in one transaction per batch,
+    as soon as ``max_batch`` ops are waiting or every ``flush_interval``
+    seconds. ``flush`` writes everything synchronously; it runs on shutdown,
+    before reports and before a session with queued ops is re-read from the
+    database.
+
+    Sessions this worker has touched are served from its cache without
+    re-reading the database, so writes made by other workers are not seen:
+    use it with a single worker or with sticky sessions only.
+
+    If a batch fails, its ops are retried one at a time in queue order and
+    the flush stops at the first op that still fails; the background task
+    then backs off. An op that has failed ``max_attempts`` flushes is moved
+    to ``dead_letters`` so it cannot block the queue for good.
+    """
+
+    blocking = True
+
+    def __init__(
+        self,
+        durable: DatabaseSessionStore,
+        flush_interval: float,
+        max_batch: int,
+        ttl_seconds: float,
+        max_sessions: int,
+        max_attempts: int = 5,
+    ):
+        self.durable = durable
+        self.flush_interval = flush_interval
+        self.max_batch = max(1, max_batch)
+        self.max_attempts = max(1, max_attempts)
+        self._cache = InMemorySessionStore(ttl_seconds, max_sessions)
+        # (op, failed flush attempts so far)
+        self._pending: List[Tuple[Op, int]] = []
+        self._pending_sessions: Set[str] = set()
+        # Guards the queue; routes in the threadpool enqueue too
+        self._lock = threading.Lock()
+        # One flush at a time, so ops reach the database in queue order
+        self._flush_lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+        self.flushed_ops = 0
+        self.failed_flushes = 0
+        self._consecutive_failures = 0
+        self.dead_letters: Deque[Op] = deque(maxlen=1000)
+
+    # ------------------------------------------------------------------
+    # Queue
+    # ------------------------------------------------------------------
+    def _enqueue(self, op: Op) -> None:
+        with self._lock:
+            self._pending.append((op, 0))
+            self._pending_sessions.add(op[1])
+            full = len(self._pending) >= self.max_batch
+        if full and self._wakeup is not None:
+            try:
+                self._loop.call_soon_threadsafe(self._wakeup.set)
+            except RuntimeError:
+                # Loop already closed; aclose() flushes what is left
+                pass
+
+    @property
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self) -> int:
+        """Write all queued ops now; returns how many were written."""
+        with self._flush_lock:
+            with self._lock:
+                entries, self._pending = self._pending, []
+            if not entries:
+                return 0
+            try:
+                self.durable.apply([op for op, _ in entries])
+                written, retry = len(entries), []
+            except Exception as e:
+                self.failed_flushes += 1
+                print(f"❌ Session write-behind flush of {len(entries)} ops failed, retrying one by one: {e}")
+                written, retry = self._apply_each(entries)
+            self._consecutive_failures = self._consecutive_failures + 1 if retry else 0
+            with self._lock:
+                self._pending[:0] = retry
+                self._pending_sessions = {op[1] for op, _ in self._pending}
+            self.flushed_ops += written
+            return written
+
+    def _apply_each(self, entries: List[Tuple[Op, int]]) -> Tuple[int, List[Tuple[Op, int]]]:
+        """Apply ops singly; returns (written, entries left for the next flush)."""
+        written = 0
+        for position, (op, attempts) in enumerate(entries):
+            try:
+                self.durable.apply([op])
+            except DuplicateAnswerError:
+                print(f"⚠️ Skipped duplicate answer write for {op[1]}")
+                continue
+            except Exception as e:
+                attempts += 1
+                if attempts < self.max_attempts:
+                    # Keep queue order: this op and everything after it wait
+                    return written, [(op, attempts)] + entries[position + 1:]
+                self.dead_letters.append(op)
+                print(f"❌ Dropped session write '{op[0]}' for {op[1]} after {attempts} failed flushes: {e}")
+                continue
+            written += 1
+        return written, []
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            if self._consecutive_failures:
+                # Database trouble: back off instead of retrying on every wakeup
+                await asyncio.sleep(
+                    min(self.flush_interval * 2 ** self._consecutive_failures, _MAX_FLUSH_BACKOFF)
+                )
+            else:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+            self._wakeup.clear()
+            await asyncio.to_thread(self.flush)
+
+    async def aclose(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        written = self.flush()
+        if written:
+            print(f"💾 Flushed {written} queued session writes on shutdown")
+
+    # ------------------------------------------------------------------
+    # SessionStore
+    # ------------------------------------------------------------------
+    def get(self, session_id: str) -> Optional[SessionData]:
+        session = self._cache.get(session_id)
+        if session is not None:
+            return session
+        with self._lock:
+            queued = session_id in self._pending_sessions
+        if queued:
+            self.flush()
+        session = self.durable.get(session_id)
+        if session is not None:
+            self._cache.create(session_id, session)
+        return session
+
+    def create(self, session_id: str, session: SessionData) -> None:
+        self._cache.create(session_id, session)
+        self._enqueue(self.durable.create_op(session_id, session))
+
+    def delete(self, session_id: str) -> None:
+        self._cache.delete(session_id)
+        self._enqueue(("delete", session_id, None))
+
+    def items(self) -> List[Tuple[str, SessionData]]:
+        self.flush()
+        return self.durable.items()
+
+    def add_question(self, session_id: str, session: SessionData, question: Dict[str, Any]) -> None:
+        self._cache.add_question(session_id, session, question)
+        self._enqueue(self.durable.questions_op(session_id, session))
+
+    def add_answer(self, session_id: str, session: SessionData, record: Dict[str, Any]) -> int:
+        index = self._cache.add_answer(session_id, session, record)
+        self._enqueue(self.durable.answer_op(session_id, session, index))
+        return index
+
+    def update_answer(self, session_id: str, session: SessionData, index: int) -> None:
+        self._enqueue(self.durable.answer_op(session_id, session, index, update=True))
+
+    def add_metrics(self, session_id: str, session: SessionData, entry: Dict[str, Any]) -> None:
+        self._cache.add_metrics(session_id, session, entry)
+        self._enqueue(self.durable.state_op(session_id, session))
+
+
+def create_session_store() -> SessionStore:
+    """The store selected by ``SESSION_STORE`` ("memory" or "database")."""
+    backend = (settings.SESSION_STORE or "memory").lower()
+    if backend == "database":
+        durable = DatabaseSessionStore()
+        if not settings.SESSION_WRITE_BEHIND:
+            return durable
+        return WriteBehindSessionStore(
+            durable,
+            flush_interval=settings.SESSION_FLUSH_INTERVAL,
+            max_batch=settings.SESSION_FLUSH_BATCH_SIZE,
+            ttl_seconds=settings.SESSION_TTL_SECONDS,
+            max_sessions=settings.SESSION_MAX_SESSIONS,
+            max_attempts=settings.SESSION_FLUSH_MAX_ATTEMPTS,
+        )
+    if backend != "memory":
+        print(f"⚠️ Unknown SESSION_STORE '{settings.SESSION_STORE}', using in-memory sessions")
+    return InMemorySessionStore(settings.SESSION_TTL_SECONDS, settings.SESSION_MAX_SESSIONS)
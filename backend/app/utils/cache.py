@@ -0,0 +1,287 @@
+# backend/app/utils/cache.py
+import os
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+def _default_sizeof(value: Any) -> int:
+    if isinstance(value, str):
+        return len(value.encode("utf-8"))
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    return sys.getsizeof(value)
+
+
+class LRUTTLCache:
+    """
+    Thread-safe in-memory cache bounded by entry count, total bytes and TTL.
+
+    Entries live in an OrderedDict in recency order, so get/set/evict are all
+    O(1). Expired entries are dropped when read; the least recently used ones
+    are evicted whenever a limit is exceeded.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 16 * 1024 * 1024,
+        ttl_seconds: float = 3600.0,
+        sizeof: Callable[[Any], int] = _default_sizeof,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._sizeof = sizeof
+        self._data: "OrderedDict[Hashable, Tuple[Any, float, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value (marking it most recently used) or ``default``."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            value, expires_at, _ = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """Insert or replace ``key``; evicts LRU entries if limits are exceeded."""
+        size = self._sizeof(value)
+        if size > self.max_bytes:
+            return  # Would evict everything else and still not fit
+
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            self._data[key] = (value, time.monotonic() + ttl, size)
+            self._bytes += size
+
+            while len(self._data) > self.max_entries or self._bytes > self.max_bytes:
+                oldest = next(iter(self._data))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._data),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def _remove(self, key: Hashable) -> None:
+        _, _, size = self._data.pop(key)
+        self._bytes -= size
+
+
+class SQLiteCache:
+    """
+    Persistent key/value cache in a SQLite file, shared by all workers on a host.
+
+    WAL mode plus a busy timeout gives safe concurrent access from several
+    uvicorn processes. Each thread keeps its own connection. Entries carry a
+    last-access timestamp and the least recently used rows are evicted once
+    ``max_entries`` or ``max_bytes`` is exceeded (checked every
+    ``evict_every`` writes to keep the write path cheap). Reads never write:
+    hits are noted in memory and their last-access times are written in one
+    batch at the next eviction, and expired rows are left for eviction too.
+    Storage errors are logged and treated as misses so the cache can never
+    break a request.
+    """
+
+    # Hits remembered for the next eviction; further hits only skip the LRU refresh
+    MAX_PENDING_TOUCHES = 4096
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = 50_000,
+        max_bytes: int = 256 * 1024 * 1024,
+        ttl_seconds: float = 7 * 24 * 3600.0,
+        evict_every: int = 64,
+        busy_timeout_ms: int = 250,
+    ):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.evict_every = evict_every
+        self.busy_timeout_ms = busy_timeout_ms
+        self._local = threading.local()
+        self._writes = 0
+        self._touched: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.errors = 0
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        conn = self._conn()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " last_access REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_last_access ON cache(last_access)")
+        conn.commit()
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.busy_timeout_ms / 1000)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str, default: Any = None) -> Any:
+        now = time.time()
+        try:
+            conn = self._conn()
+            row = conn.execute(
+                "SELECT value, created_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            self.errors += 1
+            print(f"⚠️ Disk cache read failed: {e}")
+            return default
+        if row is None or now - row[1] >= self.ttl_seconds:
+            self.misses += 1
+            return default
+
+        with self._lock:
+            if key in self._touched or len(self._touched) < self.MAX_PENDING_TOUCHES:
+                self._touched[key] = now
+        self.hits += 1
+        return row[0]
+
+    def set(self, key: str, value: str) -> None:
+        now = time.time()
+        size = len(value.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        try:
+            conn = self._conn()
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, size, created_at, last_access)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, value, size, now, now),
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            self.errors += 1
+            print(f"⚠️ Disk cache write failed: {e}")
+            return
+
+        with self._lock:
+            self._writes += 1
+            due = self._writes % self.evict_every == 0
+        if due:
+            self.evict()
+
+    def evict(self) -> int:
+        """Drop expired rows, then LRU rows until both limits hold. Returns rows removed."""
+        removed = 0
+        with self._lock:
+            touched, self._touched = self._touched, {}
+        try:
+            conn = self._conn()
+            conn.executemany(
+                "UPDATE cache SET last_access = ? WHERE key = ? AND last_access < ?",
+                [(at, key, at) for key, at in touched.items()],
+            )
+            removed += conn.execute(
+                "DELETE FROM cache WHERE created_at <= ?", (time.time() - self.ttl_seconds,)
+            ).rowcount
+            count, total = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache"
+            ).fetchone()
+            while count > self.max_entries or total > self.max_bytes:
+                # Remove a slice of the oldest rows, at least the overflow in entries
+                batch = max(count - self.max_entries, max(1, count // 10))
+                rows = conn.execute(
+                    "SELECT key, size FROM cache ORDER BY last_access LIMIT ?", (batch,)
+                ).fetchall()
+                if not rows:
+                    break
+                conn.executemany("DELETE FROM cache WHERE key = ?", [(k,) for k, _ in rows])
+                count -= len(rows)
+                total -= sum(size for _, size in rows)
+                removed += len(rows)
+                self.evictions += len(rows)
+            conn.commit()
+        except sqlite3.Error as e:
+            self.errors += 1
+            print(f"⚠️ Disk cache eviction failed: {e}")
+        return removed
+
+    def clear(self) -> None:
+        try:
+            conn = self._conn()
+            conn.execute("DELETE FROM cache")
+            conn.commit()
+        except sqlite3.Error as e:
+            self.errors += 1
+            print(f"⚠️ Disk cache clear failed: {e}")
+
+    def stats(self) -> Dict[str, int]:
+        entries = total = 0
+        try:
+            entries, total = self._conn().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache"
+            ).fetchone()
+        except sqlite3.Error:
+            pass
+        return {
+            "entries": entries,
+            "bytes": total,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "errors": self.errors,
+        }
@@ -0,0 +1,130 @@
+# backend/app/utils/circuit_breaker.py
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit is open."""
+
+
+class CircuitBreaker:
+    """
+    Closed / open / half-open circuit breaker over a sliding window of calls.
+
+    A call counts as failed if it errored or took longer than
+    ``slow_call_seconds``. Once the window holds at least ``min_calls`` and
+    the failure rate reaches ``failure_rate``, the circuit opens and callers
+    are rejected immediately. After ``reset_seconds`` it goes half-open and
+    lets ``half_open_calls`` trial calls through: if they all succeed the
+    circuit closes, and any failure re-opens it.
+    """
+
+    def __init__(
+        self,
+        window: int = 20,
+        min_calls: int = 5,
+        failure_rate: float = 0.5,
+        slow_call_seconds: float = 20.0,
+        reset_seconds: float = 30.0,
+        half_open_calls: int = 1,
+    ):
+        self.min_calls = min_calls
+        self.failure_rate = failure_rate
+        self.slow_call_seconds = slow_call_seconds
+        self.reset_seconds = reset_seconds
+        self.half_open_calls = max(1, half_open_calls)
+        self._outcomes: Deque[bool] = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._trials_started = 0
+        self._trials_passed = 0
+        self.rejected = 0
+        self.times_opened = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def is_open(self) -> bool:
+        """Cheap check for callers that want to skip work while the circuit is open."""
+        return self.state == OPEN
+
+    def allow_request(self) -> bool:
+        """Return True if a call may proceed; reserves a trial slot when half-open."""
+        with self._lock:
+            self._maybe_half_open()
+            if self._state == CLOSED:
+                return True
+            if self._state == HALF_OPEN and self._trials_started < self.half_open_calls:
+                self._trials_started += 1
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self, latency: float) -> None:
+        if latency > self.slow_call_seconds:
+            self.record_failure(latency)
+            return
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._trials_passed += 1
+                if self._trials_passed >= self.half_open_calls:
+                    self._close()
+                return
+            self._outcomes.append(True)
+
+    def record_failure(self, latency: float = 0.0) -> None:
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._open()
+                return
+            self._outcomes.append(False)
+            if self._state == CLOSED and len(self._outcomes) >= self.min_calls:
+                failures = self._outcomes.count(False)
+                if failures / len(self._outcomes) >= self.failure_rate:
+                    self._open()
+
+    def record_cancelled(self) -> None:
+        """Forget an attempt that was cancelled by the caller (neither success nor failure)."""
+        with self._lock:
+            if self._state == HALF_OPEN and self._trials_started > self._trials_passed:
+                self._trials_started -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            self._maybe_half_open()
+            window = len(self._outcomes)
+            failures = self._outcomes.count(False)
+            return {
+                "state": self._state,
+                "window_calls": window,
+                "window_failure_rate": round(failures / window, 3) if window else 0.0,
+                "rejected": self.rejected,
+                "times_opened": self.times_opened,
+            }
+
+    def _maybe_half_open(self) -> None:
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.reset_seconds:
+            self._state = HALF_OPEN
+            self._trials_started = 0
+            self._trials_passed = 0
+
+    def _open(self) -> None:
+        self._state = OPEN
+        self._opened_at = time.monotonic()
+        self.times_opened += 1
+        print(f"⚡ Circuit opened; rejecting calls for {self.reset_seconds:g}s")
+
+    def _close(self) -> None:
+        self._state = CLOSED
+        self._outcomes.clear()
+        print("✅ Circuit closed; upstream recovered")
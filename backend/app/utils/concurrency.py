@@ -0,0 +1,298 @@
+# backend/app/utils/concurrency.py
+import asyncio
+import threading
+import time
+import weakref
+from contextlib import asynccontextmanager, contextmanager
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterator,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+T = TypeVar("T")
+
+
+class _Call(Generic[T]):
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.result: Optional[T] = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls that share a key (thread-based callers).
+
+    The first caller for a key runs ``fn``; callers arriving while it is in
+    flight block until it finishes and receive the same result (or error).
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, _Call[Any]] = {}
+        self._lock = threading.Lock()
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+        return call.result
+
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+
+class AsyncSingleFlight:
+    """
+    Coalesce concurrent coroutine calls that share a key.
+
+    The work runs in its own task and every caller awaits it through
+    ``asyncio.shield``, so a cancelled or timed-out caller never cancels the
+    shared upstream call for the others.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, "asyncio.Task[Any]"] = {}
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        task, _ = self.start(key, fn)
+        return await asyncio.shield(task)
+
+    def start(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> "Tuple[asyncio.Task[T], bool]":
+        """The in-flight task for ``key`` (starting ``fn`` if there is none) and whether this call started it."""
+        task = self._calls.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda t, key=key: self._forget(key, t))
+            return task, True
+        self.coalesced += 1
+        return task, False
+
+    def _forget(self, key: Hashable, task: "asyncio.Task[Any]") -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            task.exception()  # Mark retrieved so unawaited failures are not logged
+
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+
+class _KeyedLockEntry:
+    __slots__ = ("lock", "users")
+
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.users = 0
+
+
+class KeyedAsyncLock:
+    """
+    One asyncio lock per key, created on demand and dropped once unused.
+
+    Holders of the same key run one at a time while different keys never
+    wait on each other, and memory is bounded by the keys currently held or
+    awaited. Per process/event loop only.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[Hashable, _KeyedLockEntry] = {}
+        self.contended = 0
+
+    @asynccontextmanager
+    async def hold(self, key: Hashable) -> AsyncIterator[None]:
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = _KeyedLockEntry()
+        elif entry.lock.locked():
+            self.contended += 1
+        entry.users += 1
+        try:
+            async with entry.lock:
+                yield
+        finally:
+            entry.users -= 1
+            if not entry.users and self._entries.get(key) is entry:
+                del self._entries[key]
+
+    def held(self) -> int:
+        return len(self._entries)
+
+
+class GovernorTimeout(Exception):
+    """Raised when a request could not get a rate/concurrency slot before its deadline."""
+
+
+class RateGovernor:
+    """
+    Token-bucket rate limiter combined with a max-concurrency limit.
+
+    Callers over the limit queue instead of failing, up to ``max_wait``
+    seconds (or an explicit deadline), after which ``GovernorTimeout`` is
+    raised. Tokens are reserved up front, so queued callers are served in
+    arrival order at the configured rate. ``stats()`` exposes queue depth,
+    in-flight count and wait times.
+
+    Thread callers use ``acquire()``; coroutines use ``acquire_async()``.
+    Each side has its own semaphore sized ``max_concurrency``; the token
+    bucket is shared.
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float,
+        burst: int,
+        max_concurrency: int,
+        max_wait: float,
+    ):
+        self.rate = rate_per_second
+        self.burst = max(1, burst)
+        self.max_concurrency = max_concurrency
+        self.max_wait = max_wait
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._sem = threading.BoundedSemaphore(max_concurrency)
+        self._async_sems: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self.queued = 0
+        self.max_queued = 0
+        self.in_flight = 0
+        self.acquired = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait_seen = 0.0
+
+    def _reserve(self, deadline: float) -> float:
+        """Take one token, returning how long to sleep before it is valid."""
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            wait = max(0.0, (1.0 - self._tokens) / self.rate)
+            if now + wait > deadline:
+                raise GovernorTimeout(f"rate limit wait {wait:.1f}s exceeds deadline")
+            self._tokens -= 1.0
+            return wait
+
+    def _enter_queue(self) -> float:
+        with self._lock:
+            self.queued += 1
+            self.max_queued = max(self.max_queued, self.queued)
+        return time.monotonic()
+
+    def _leave_queue(self, started: float, ok: bool) -> None:
+        waited = time.monotonic() - started
+        with self._lock:
+            self.queued -= 1
+            if ok:
+                self.acquired += 1
+                self.in_flight += 1
+                self.total_wait += waited
+                self.max_wait_seen = max(self.max_wait_seen, waited)
+            else:
+                self.timeouts += 1
+
+    def _release(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+    def _deadline(self, deadline: Optional[float]) -> float:
+        limit = time.monotonic() + self.max_wait
+        return limit if deadline is None else min(limit, deadline)
+
+    @contextmanager
+    def acquire(self, deadline: Optional[float] = None) -> Iterator[None]:
+        deadline = self._deadline(deadline)
+        started = self._enter_queue()
+        ok = False
+        try:
+            wait = self._reserve(deadline)
+            if wait:
+                time.sleep(wait)
+            if not self._sem.acquire(timeout=max(0.0, deadline - time.monotonic())):
+                raise GovernorTimeout("concurrency limit wait exceeds deadline")
+            ok = True
+        finally:
+            self._leave_queue(started, ok)
+        try:
+            yield
+        finally:
+            self._sem.release()
+            self._release()
+
+    @asynccontextmanager
+    async def acquire_async(self, deadline: Optional[float] = None) -> AsyncIterator[None]:
+        loop = asyncio.get_running_loop()
+        sem = self._async_sems.get(loop)
+        if sem is None:
+            sem = self._async_sems[loop] = asyncio.Semaphore(self.max_concurrency)
+
+        deadline = self._deadline(deadline)
+        started = self._enter_queue()
+        ok = False
+        try:
+            wait = self._reserve(deadline)
+            if wait:
+                await asyncio.sleep(wait)
+            try:
+                await asyncio.wait_for(sem.acquire(), max(0.0, deadline - time.monotonic()))
+            except asyncio.TimeoutError:
+                raise GovernorTimeout("concurrency limit wait exceeds deadline") from None
+            ok = True
+        finally:
+            self._leave_queue(started, ok)
+        try:
+            yield
+        finally:
+            sem.release()
+            self._release()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "queue_depth": self.queued,
+                "max_queue_depth": self.max_queued,
+                "in_flight": self.in_flight,
+                "acquired": self.acquired,
+                "timeouts": self.timeouts,
+                "avg_wait_seconds": round(self.total_wait / self.acquired, 4) if self.acquired else 0.0,
+                "max_wait_seconds": round(self.max_wait_seen, 4),
+            }
@@ -0,0 +1,65 @@
+# backend/app/utils/hedging.py
+import threading
+from collections import deque
+from typing import Any, Deque, Dict
+
+
+class LatencyTracker:
+    """Rolling window of call latencies with percentile lookup."""
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self.min_samples = min_samples
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, pct: float, default: float) -> float:
+        """Return the ``pct`` percentile, or ``default`` until enough samples exist."""
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return default
+            ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+        return ordered[index]
+
+
+class HedgeBudget:
+    """
+    Caps hedged (duplicate) requests to ``ratio`` of primary requests.
+
+    With ``ratio=0.1`` hedging adds at most 10% extra upstream calls.
+    """
+
+    def __init__(self, ratio: float):
+        self.ratio = ratio
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def record_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            if self.hedges + 1 > self.ratio * self.requests:
+                return False
+            self.hedges += 1
+            return True
+
+    def record_hedge_win(self) -> None:
+        with self._lock:
+            self.hedge_wins += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "hedges": self.hedges,
+                "hedge_wins": self.hedge_wins,
+                "ratio": self.ratio,
+            }
@@ -0,0 +1,72 @@
+# backend/app/utils/json_stream.py
+import json
+from typing import Any, List
+
+
+class JSONArrayStreamParser:
+    """
+    Incremental parser for a streamed top-level JSON array of objects.
+
+    ``feed()`` takes text chunks as they arrive and returns every element
+    completed so far, as soon as its closing brace is seen. Text before the
+    opening ``[`` (e.g. a markdown fence) and after the closing ``]`` is
+    ignored. Elements that fail to decode are skipped. Scalar elements are
+    not captured.
+    """
+
+    def __init__(self) -> None:
+        self._started = False
+        self._finished = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._capture: List[str] = []
+        self._capturing = False
+        self.skipped = 0
+
+    @property
+    def finished(self) -> bool:
+        return self._finished
+
+    def feed(self, chunk: str) -> List[Any]:
+        items: List[Any] = []
+        for ch in chunk:
+            if self._finished:
+                break
+            if not self._started:
+                if ch == "[":
+                    self._started = True
+                    self._depth = 1
+                continue
+
+            if self._capturing:
+                self._capture.append(ch)
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                continue
+
+            if ch == '"':
+                self._in_string = True
+            elif ch in "{[":
+                self._depth += 1
+                if self._depth == 2 and not self._capturing:
+                    self._capturing = True
+                    self._capture = [ch]
+            elif ch in "}]":
+                self._depth -= 1
+                if self._depth == 1 and self._capturing:
+                    self._capturing = False
+                    try:
+                        items.append(json.loads("".join(self._capture)))
+                    except json.JSONDecodeError:
+                        self.skipped += 1
+                    self._capture = []
+                elif self._depth == 0:
+                    self._finished = True
+        return items
@@ -0,0 +1,103 @@
+# backend/app/utils/keyword_matcher.py
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+def _trie_pattern(node: Dict[str, dict]) -> str:
+    """Regex source for a keyword trie; greedy, so the longest keyword wins at a position."""
+    branches = [re.escape(ch) + _trie_pattern(child) for ch, child in sorted(node.items()) if ch]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    return f"(?:{body})?" if "" in node else body
+
+
+class KeywordHits:
+    """Keyword occurrences found by ``KeywordMatcher.scan``, grouped by lexicon."""
+
+    __slots__ = ("_hits",)
+
+    def __init__(self, hits: Dict[str, List[Tuple[str, int]]]):
+        # lexicon -> [(keyword, end offset)]
+        self._hits = hits
+
+    def count(self, lexicon: str) -> int:
+        """Total occurrences of the lexicon's keywords."""
+        return len(self._hits.get(lexicon, ()))
+
+    def found(self, lexicon: str, within: Optional[int] = None) -> Set[str]:
+        """Distinct keywords seen, optionally only those ending in the first ``within`` characters."""
+        return {
+            keyword
+            for keyword, end in self._hits.get(lexicon, ())
+            if within is None or end <= within
+        }
+
+    def first_seen(self, lexicon: str) -> List[str]:
+        """Distinct keywords in the order they first appear in the text."""
+        return list(dict.fromkeys(keyword for keyword, _ in self._hits.get(lexicon, ())))
+
+    def any(self, lexicon: str) -> bool:
+        return bool(self._hits.get(lexicon))
+
+
+class KeywordMatcher:
+    """
+    Find the keywords of several lexicons in one pass over a text.
+
+    All keywords are compiled once into a trie-shaped regex wrapped in a
+    lookahead, so a single ``finditer`` visits every position and follows
+    only the trie branch matching the next characters (Aho-Corasick-style
+    single pass, run by the C regex engine rather than a Python loop).
+    Overlapping hits and keywords that are prefixes of longer ones are all
+    reported. Matching is case-insensitive; lexicons listed in
+    ``whole_words`` only match at word boundaries, the rest match anywhere
+    (like ``keyword in text``).
+    """
+
+    def __init__(self, lexicons: Dict[str, Iterable[str]], whole_words: Iterable[str] = ()):
+        whole = set(whole_words)
+        self._lexicons: Dict[str, List[Tuple[str, bool]]] = {}
+        trie: Dict[str, dict] = {}
+        for lexicon, keywords in lexicons.items():
+            for keyword in keywords:
+                keyword = keyword.lower()
+                if not keyword:
+                    continue
+                self._lexicons.setdefault(keyword, []).append((lexicon, lexicon in whole))
+                node = trie
+                for ch in keyword:
+                    node = node.setdefault(ch, {})
+                node[""] = {}
+
+        # Keywords that are prefixes of each keyword (itself included)
+        self._prefixes: Dict[str, List[str]] = {
+            keyword: [k for k in self._lexicons if keyword.startswith(k)]
+            for keyword in self._lexicons
+        }
+        source = _trie_pattern(trie)
+        self._pattern = re.compile(f"(?=({source}))") if source else None
+
+    def scan(self, text: str) -> KeywordHits:
+        hits: Dict[str, List[Tuple[str, int]]] = {}
+        if not text or self._pattern is None:
+            return KeywordHits(hits)
+
+        text = text.lower()
+        size = len(text)
+        for match in self._pattern.finditer(text):
+            start = match.start()
+            for keyword in self._prefixes[match.group(1)]:
+                end = start + len(keyword)
+                bounded = (start == 0 or not _is_word_char(text[start - 1])) and (
+                    end == size or not _is_word_char(text[end])
+                )
+                for lexicon, whole_word in self._lexicons[keyword]:
+                    if whole_word and not bounded:
+                        continue
+                    hits.setdefault(lexicon, []).append((keyword, end))
+        return KeywordHits(hits)
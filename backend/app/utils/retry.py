@@ -0,0 +1,67 @@
+# backend/app/utils/retry.py
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Optional
+
+
+class RetryPolicy:
+    """
+    Bounded retry schedule with decorrelated jitter.
+
+    Each delay is drawn from ``uniform(base_delay, previous * 3)`` capped at
+    ``max_delay``; a server ``Retry-After`` acts as a floor. No retry is
+    scheduled once attempts are exhausted or the delay would not fit in the
+    caller's remaining time budget.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 8.0,
+        retry_statuses: Iterable[int] = (429, 500, 502, 503, 504),
+    ):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = frozenset(retry_statuses)
+
+    def is_retryable_status(self, status_code: int) -> bool:
+        return status_code in self.retry_statuses
+
+    def next_delay(self, previous: float) -> float:
+        upper = max(self.base_delay, previous * 3)
+        return min(self.max_delay, random.uniform(self.base_delay, upper))
+
+    def delay_for(
+        self,
+        attempt: int,
+        previous: float,
+        remaining: float,
+        retry_after: Optional[float] = None,
+    ) -> Optional[float]:
+        """Delay before attempt ``attempt + 1``, or None if we should give up."""
+        if attempt >= self.max_attempts:
+            return None
+        delay = self.next_delay(previous)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        if delay >= remaining:
+            return None
+        return delay
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
@@ -2,6 +2,40 @@
 import re
 from typing import List
 
+from app.utils.keyword_matcher import KeywordHits, KeywordMatcher
+
+FILLER_WORDS = ['um', 'uh', 'like', 'you know', 'actually', 'basically', 'literally']
+POSITIVE_WORDS = ['good', 'great', 'excellent', 'success', 'achieved', 'improved']
+NEGATIVE_WORDS = ['bad', 'failed', 'difficult', 'challenge', 'problem', 'issue']
+SITUATION_KEYWORDS = ['situation', 'background', 'context', 'when', 'at that time']
+TASK_KEYWORDS = ['task', 'responsibility', 'role', 'expected to', 'needed to']
+ACTION_KEYWORDS = ['action', 'did', 'implemented', 'used', 'applied', 'took']
+RESULT_KEYWORDS = ['result', 'outcome', 'achieved', 'learned', 'improved']
+OUTCOME_KEYWORDS = ['result', 'outcome', 'achieved', 'improved', 'increased', 'decreased']
+
+STAR_LEXICONS = ('star_situation', 'star_task', 'star_action', 'star_result')
+
+# Every answer lexicon in one matcher, so an answer is scanned once for all of them.
+# Fillers are whole words; the others keep their substring semantics.
+ANSWER_MATCHER = KeywordMatcher(
+    {
+        'filler': FILLER_WORDS,
+        'positive': POSITIVE_WORDS,
+        'negative': NEGATIVE_WORDS,
+        'star_situation': SITUATION_KEYWORDS,
+        'star_task': TASK_KEYWORDS,
+        'star_action': ACTION_KEYWORDS,
+        'star_result': RESULT_KEYWORDS,
+        'outcome': OUTCOME_KEYWORDS,
+    },
+    whole_words=['filler'],
+)
+
+
+def scan_answer(text: str) -> KeywordHits:
+    """Find all answer-lexicon keywords (fillers, sentiment, STAR, outcomes) in one pass"""
+    return ANSWER_MATCHER.scan(text or "")
+
 def clean_text(text: str) -> str:
     """Clean and normalize text"""
     if not text:
@@ -17,15 +51,7 @@ def clean_text(text: str) -> str:
 
 def count_filler_words(text: str) -> int:
     """Count filler words in text"""
-    filler_words = ['um', 'uh', 'like', 'you know', 'actually', 'basically', 'literally']
-    
-    count = 0
-    text_lower = text.lower()
-    
-    for word in filler_words:
-        count += len(re.findall(r'\b' + re.escape(word) + r'\b', text_lower))
-    
-    return count
+    return scan_answer(text).count('filler')
 
 def calculate_speech_metrics(text: str, duration_seconds: int) -> dict[str, float]:
     """Calculate speech metrics from text and duration"""
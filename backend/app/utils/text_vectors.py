@@ -0,0 +1,132 @@
+# backend/app/utils/text_vectors.py
+import re
+import zlib
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+N_FEATURES = 1 << 18
+# Cosine similarity at or above this maps to a relevance of 1.0
+FULL_RELEVANCE_SIMILARITY = 0.5
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#.\-]*[a-z0-9+#]|[a-z0-9]")
+_STOP_WORDS = frozenset(
+    """a an and are as at be been but by can could did do does for from had has have
+    how i if in into is it its me my of on or our so that the their them then there
+    these they this to was we were what when where which while who why will with
+    would you your um uh like just really very also""".split()
+)
+
+
+class SparseVector:
+    """
+    L2-normalised sparse vector as sorted feature indices plus float32 weights.
+
+    ``dot`` is one sorted-index intersection and a multiply-add, so scoring an
+    answer against a cached reference costs O(nnz) with no Python loops.
+    """
+
+    __slots__ = ("indices", "values")
+
+    def __init__(self, indices: np.ndarray, values: np.ndarray):
+        self.indices = indices
+        self.values = values
+
+    @property
+    def nnz(self) -> int:
+        return int(self.indices.size)
+
+    def dot(self, other: "SparseVector") -> float:
+        if not self.nnz or not other.nnz:
+            return 0.0
+        _, mine, theirs = np.intersect1d(
+            self.indices, other.indices, assume_unique=True, return_indices=True
+        )
+        return float(np.dot(self.values[mine], other.values[theirs]))
+
+    def to_dict(self) -> Dict[str, List[Any]]:
+        """JSON-friendly form for storing on a session."""
+        return {"indices": self.indices.tolist(), "values": self.values.tolist()}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, List[Any]]) -> "SparseVector":
+        return cls(
+            np.asarray(data.get("indices", []), dtype=np.int64),
+            np.asarray(data.get("values", []), dtype=np.float32),
+        )
+
+
+def tokenize(text: str) -> List[str]:
+    return [t for t in _TOKEN_RE.findall(text.lower()) if t not in _STOP_WORDS]
+
+
+def _features(tokens: List[str]) -> Iterable[str]:
+    yield from tokens
+    # Word bigrams capture short phrases like "load balancer"
+    for first, second in zip(tokens, tokens[1:]):
+        yield f"{first} {second}"
+
+
+def _from_counts(counts: Dict[int, float]) -> SparseVector:
+    if not counts:
+        return SparseVector(np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32))
+    indices = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))
+    values = np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+    order = np.argsort(indices)
+    indices, values = indices[order], values[order]
+    # Sublinear term frequency damps words repeated over and over
+    values = 1.0 + np.log(values)
+    values /= np.linalg.norm(values)
+    return SparseVector(indices, values)
+
+
+def _accumulate(counts: Dict[int, float], text: str, weight: float = 1.0) -> None:
+    for feature in _features(tokenize(text)):
+        # crc32 rather than hash(): stable across processes, so stored vectors stay valid
+        index = zlib.crc32(feature.encode("utf-8")) % N_FEATURES
+        counts[index] = counts.get(index, 0.0) + weight
+
+
+def vectorize(text: str) -> SparseVector:
+    """Hashed unigram+bigram vector of ``text``."""
+    counts: Dict[int, float] = {}
+    _accumulate(counts, text or "")
+    return _from_counts(counts)
+
+
+@lru_cache(maxsize=512)
+def vectorize_cached(text: str) -> SparseVector:
+    """``vectorize`` memoised for texts that repeat, such as question prompts."""
+    return vectorize(text)
+
+
+def reference_vector(
+    ideal_answer: str,
+    expected_keywords: Optional[List[str]] = None,
+    question_text: str = "",
+    keyword_weight: float = 2.0,
+) -> SparseVector:
+    """
+    One vector describing a good answer to a question.
+
+    Combines the ideal answer, the expected keywords (weighted up, since they
+    are what an evaluator looks for) and the question text, so an answer is
+    scored with a single dot product.
+    """
+    counts: Dict[int, float] = {}
+    _accumulate(counts, ideal_answer or "")
+    _accumulate(counts, question_text or "")
+    for keyword in expected_keywords or []:
+        _accumulate(counts, str(keyword), keyword_weight)
+    return _from_counts(counts)
+
+
+def similarity_to_relevance(similarity: float) -> float:
+    """Map a cosine similarity to a 0-1 relevance (``FULL_RELEVANCE_SIMILARITY`` and above is 1)."""
+    return max(0.0, min(1.0, similarity / FULL_RELEVANCE_SIMILARITY))
+
+
+def relevance(reference: SparseVector, answer: str) -> float:
+    """0-1 relevance of ``answer`` to a precomputed reference vector."""
+    return similarity_to_relevance(reference.dot(vectorize(answer)))
@@ -0,0 +1,110 @@
+# backend/app/utils/tokens.py
+import re
+import threading
+from typing import Any, Dict, List
+
+# Rough average for English text with BPE tokenizers
+CHARS_PER_TOKEN = 4
+# Per-message framing overhead of the chat format
+MESSAGE_OVERHEAD_TOKENS = 4
+
+# Spoken fillers that carry no meaning in a transcript. Words like "like" or
+# "actually" are left alone because they are often meaningful in answers.
+_FILLER_RE = re.compile(r"\b(?:u+m+|u+h+|uhm+|e+r+m+|hmm+|you know|i mean)\b[,.]?\s*", re.IGNORECASE)
+_REPEATED_WORD_RE = re.compile(r"\b(\w+)(?:\s+\1\b)+", re.IGNORECASE)
+_SENTENCE_RE = re.compile(r"[^.!?]+[.!?]*")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (~4 characters per token); no tokenizer needed."""
+    if not text:
+        return 0
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def estimate_message_tokens(messages: List[Dict[str, str]]) -> int:
+    return sum(
+        estimate_tokens(m.get("content") or "") + MESSAGE_OVERHEAD_TOKENS for m in messages
+    )
+
+
+def _dedupe_sentences(text: str) -> str:
+    seen = set()
+    kept: List[str] = []
+    for sentence in _SENTENCE_RE.findall(text):
+        sentence = sentence.strip()
+        key = re.sub(r"[^\w\s]", "", sentence.lower()).strip()
+        if not key or key in seen:
+            continue
+        seen.add(key)
+        kept.append(sentence)
+    return " ".join(kept)
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Cut ``text`` to about ``max_tokens``, keeping the start and the end.
+
+    Answers tend to state the point up front and conclude at the end, so
+    two thirds of the budget go to the head and one third to the tail.
+    """
+    if max_tokens <= 0:
+        return ""
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    if len(text) <= max_chars:
+        return text
+
+    marker = " ... "
+    head_chars = (max_chars - len(marker)) * 2 // 3
+    tail_chars = max_chars - len(marker) - head_chars
+    head = text[:head_chars].rsplit(" ", 1)[0]
+    tail = text[len(text) - tail_chars:].split(" ", 1)[-1] if tail_chars > 0 else ""
+    return f"{head}{marker}{tail}".strip()
+
+
+def compact_text(text: str, max_tokens: int) -> str:
+    """
+    Shrink free text (e.g. a spoken transcript) to fit ``max_tokens``.
+
+    Collapses whitespace; if that is not enough, drops filler words and
+    stuttered repeats, removes repeated sentences, then truncates. Text that
+    already fits is left as spoken, since fillers are part of what the
+    communication score looks at.
+    """
+    if not text:
+        return ""
+    text = _WHITESPACE_RE.sub(" ", text).strip()
+    if estimate_tokens(text) <= max_tokens:
+        return text
+
+    text = _FILLER_RE.sub("", text)
+    text = _REPEATED_WORD_RE.sub(r"\1", text)
+    text = _dedupe_sentences(text)
+    text = _WHITESPACE_RE.sub(" ", text).strip()
+    return truncate_to_tokens(text, max_tokens)
+
+
+class PromptTokenStats:
+    """Running totals of estimated prompt tokens for requests sent upstream."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.total_tokens = 0
+        self.max_tokens = 0
+
+    def record(self, tokens: int) -> None:
+        with self._lock:
+            self.requests += 1
+            self.total_tokens += tokens
+            self.max_tokens = max(self.max_tokens, tokens)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "estimated_prompt_tokens": self.total_tokens,
+                "avg_prompt_tokens": round(self.total_tokens / self.requests, 1) if self.requests else 0.0,
+                "max_prompt_tokens": self.max_tokens,
+            }
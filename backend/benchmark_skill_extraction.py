@@ -0,0 +1,129 @@
+# backend/benchmark_skill_extraction.py
+"""
+Benchmark ResumeService._extract_skills against the previous implementation
+(one compiled ``\\b...\\b`` regex search per known skill plus a nested loop
+over list items and known skills) on the files in data/uploads.
+
+Usage:
+    python benchmark_skill_extraction.py [--repeat 50] [--uploads data/uploads]
+"""
+import argparse
+import os
+import re
+import sys
+import time
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.services.resume_service import SKILL_KEYWORDS, ResumeService  # noqa: E402
+
+
+def legacy_extract_skills(text: str) -> List[str]:
+    """The pre-matcher implementation, kept here only for comparison."""
+    skill_keywords = SKILL_KEYWORDS
+    found_skills = []
+    text_lower = text.lower()
+    lines = text.split('\n')
+
+    in_skills_section = False
+    skills_section_text = ""
+    for line in lines:
+        line_lower = line.lower().strip()
+        if any(keyword in line_lower for keyword in ['skills', 'technical skills', 'core competencies',
+                                                      'technologies', 'tools & technologies', 'expertise']):
+            if len(line.strip()) < 50:
+                in_skills_section = True
+                continue
+        if in_skills_section:
+            if line.strip() and not line.strip().startswith(('experience', 'education', 'projects', 'work')):
+                skills_section_text += " " + line.lower()
+            else:
+                break
+
+    search_text = skills_section_text if skills_section_text else text_lower
+    for skill in skill_keywords:
+        pattern = r'\b' + re.escape(skill.lower()) + r'\b'
+        if re.search(pattern, search_text):
+            found_skills.append(skill.title())
+
+    skill_list_pattern = r'(?:skills?|technologies?|tools?)[\s:]+([^\.\n]{10,200})'
+    for skill_list in re.findall(skill_list_pattern, text_lower):
+        for potential_skill in re.split(r'[,;•\-\|]', skill_list):
+            skill_clean = potential_skill.strip()
+            if len(skill_clean) > 2 and len(skill_clean) < 30:
+                for known_skill in skill_keywords:
+                    if known_skill.lower() in skill_clean.lower() or skill_clean.lower() in known_skill.lower():
+                        found_skills.append(skill_clean.title())
+                        break
+
+    unique_skills = []
+    seen = set()
+    for skill in found_skills:
+        if skill.lower() not in seen:
+            seen.add(skill.lower())
+            unique_skills.append(skill)
+    return unique_skills[:20]
+
+
+def load_texts(uploads: str) -> Dict[str, str]:
+    service = ResumeService(db=None)
+    texts = {}
+    for name in sorted(os.listdir(uploads)):
+        path = os.path.join(uploads, name)
+        ext = name.lower().rsplit('.', 1)[-1]
+        try:
+            if ext == 'pdf':
+                text = service._extract_text_from_pdf(path)
+            elif ext == 'docx':
+                text = service._extract_text_from_docx(path)
+            elif ext == 'txt':
+                with open(path, 'r', encoding='utf-8') as f:
+                    text = f.read()
+            else:
+                continue
+        except Exception as e:
+            print(f"⚠️ Skipping {name}: {e}")
+            continue
+        if text.strip():
+            texts[name] = text
+    return texts
+
+
+def time_per_call(func, text: str, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(text)
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=50, help="Extractions per file and implementation")
+    parser.add_argument("--uploads", default=os.path.join("data", "uploads"), help="Directory of resumes")
+    args = parser.parse_args()
+
+    texts = load_texts(args.uploads)
+    if not texts:
+        print(f"❌ No readable files in {args.uploads}")
+        return 1
+
+    service = ResumeService(db=None)
+    total_legacy = total_current = 0.0
+    print(f"{'file':<45} {'chars':>7} {'legacy ms':>10} {'matcher ms':>11} {'speedup':>8}")
+    for name, text in texts.items():
+        legacy = time_per_call(legacy_extract_skills, text, args.repeat)
+        current = time_per_call(service._extract_skills, text, args.repeat)
+        total_legacy += legacy
+        total_current += current
+        print(f"{name[:45]:<45} {len(text):>7} {legacy * 1000:>10.3f} {current * 1000:>11.3f} {legacy / current:>7.1f}x")
+
+    print(
+        f"{'total':<45} {sum(len(t) for t in texts.values()):>7} "
+        f"{total_legacy * 1000:>10.3f} {total_current * 1000:>11.3f} {total_legacy / total_current:>7.1f}x"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,9 @@
 # backend/create_tables.py
-from app.database import engine, Base
-from app.models import user, interview, response, report, resume
+from app.database import ensure_schema
 
 def create_tables():
-    """Create all database tables"""
-    Base.metadata.create_all(bind=engine)
+    """Create all database tables and add columns missing from older databases"""
+    ensure_schema()
     print("Database tables created successfully!")
 
 if __name__ == "__main__":
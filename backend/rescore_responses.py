@@ -0,0 +1,54 @@
+# backend/rescore_responses.py
+"""
+Re-score stored interview responses with the current evaluation prompt/model.
+
+Usage:
+    python rescore_responses.py [--page-size 200] [--concurrency 4] [--limit N]
+                                [--checkpoint data/rescore_checkpoint.json]
+                                [--restart] [--dry-run]
+"""
+import argparse
+import asyncio
+
+from app.ai_engines.openrouter_engine import aclose_http_clients
+from app.database import SessionLocal, ensure_schema
+from app.services.rescoring_service import RescoringService
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Re-score stored responses")
+    parser.add_argument("--page-size", type=int, default=200, help="Rows read and committed per page")
+    parser.add_argument("--concurrency", type=int, default=4, help="LLM batches in flight")
+    parser.add_argument("--limit", type=int, default=None, help="Stop after this many rows")
+    parser.add_argument("--checkpoint", default="data/rescore_checkpoint.json", help="Checkpoint file")
+    parser.add_argument("--restart", action="store_true", help="Ignore the checkpoint and start from the first row")
+    parser.add_argument("--dry-run", action="store_true", help="Evaluate but do not write scores or checkpoint")
+    return parser.parse_args()
+
+
+async def main() -> int:
+    args = parse_args()
+    ensure_schema()
+    db = SessionLocal()
+    try:
+        service = RescoringService(
+            db,
+            checkpoint_path=args.checkpoint,
+            page_size=args.page_size,
+            concurrency=args.concurrency,
+            dry_run=args.dry_run,
+        )
+        result = await service.run(resume=not args.restart, limit=args.limit)
+    finally:
+        db.close()
+        await aclose_http_clients()
+
+    print(
+        f"Processed {result['processed']} rows: {result['updated']} updated, "
+        f"{result['failed']} queued for retry (last id {result['last_id']})"
+    )
+    return 1 if result["aborted"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(asyncio.run(main()))